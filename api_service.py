@@ -5,7 +5,7 @@ Flask-based API service that provides endpoints for the web/mobile app
 to interact with the AutoGen email processing system.
 """
 
-from flask import Flask, request, jsonify, redirect, session, url_for
+from flask import Flask, request, jsonify, redirect, session, url_for, Response, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
@@ -13,14 +13,46 @@ import json
 import requests
 import urllib.parse
 import secrets
+import uuid
+import bisect
+from string import Template
+from concurrent.futures import Future, ThreadPoolExecutor
 from google.oauth2.credentials import Credentials
-from datetime import datetime
+from datetime import datetime, date
 from typing import Dict, List, Optional
 import traceback
 
 # Load environment variables
 load_dotenv()
 
+# Optional C-accelerated ISO-8601 parser (10-50x faster than fromisoformat)
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Optional fast JSON serializer for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Redis client for the shared per-user credential cache
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional server-side session store (Flask-Session)
+try:
+    from flask_session import Session
+    FLASK_SESSION_AVAILABLE = True
+except ImportError:
+    FLASK_SESSION_AVAILABLE = False
+
 # Import our email processing system
 from complete_system import IntegratedEmailReminderSystem
 
@@ -32,10 +64,41 @@ app = Flask(__name__)
 # IMPORTANT: Set a secret key for sessions
 app.secret_key = os.environ.get('SECRET_KEY') or os.urandom(24)
 
+# Serialize jsonify responses with orjson when available - 3-10x faster than
+# stdlib json for the large scan/upcoming payloads and emits bytes directly
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """orjson-backed JSON serialization (datetime handled natively)"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            # Covers request.get_json() too - scan/reminder POST bodies
+            # parse through orjson's C decoder instead of stdlib json
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+    print("✅ orjson JSON serialization enabled")
+
 # Configure session
 app.config['SESSION_COOKIE_SAMESITE'] = 'None'  # Required for cross-site cookies
 app.config['SESSION_COOKIE_SECURE'] = True  # Required for production HTTPS
 
+# When Redis is configured, keep session data server-side so the cookie only
+# carries a session id instead of multi-KB signed credential blobs.
+if FLASK_SESSION_AVAILABLE and REDIS_AVAILABLE and os.environ.get('REDIS_URL'):
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis.Redis.from_url(os.environ['REDIS_URL']),
+        SESSION_PERMANENT=False,
+        SESSION_USE_SIGNER=True
+    )
+    Session(app)
+    print("✅ Server-side Redis sessions enabled")
+
 # Get allowed origins from environment or use defaults
 ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -70,9 +133,154 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar'
 ]
 
+# Every OAuth param except the per-request CSRF state is fixed for the life
+# of the process, so the authorization URL prefix is encoded once here
+_AUTH_URL_PREFIX = f"{GOOGLE_AUTH_URL}?" + urllib.parse.urlencode({
+    'client_id': os.environ.get('GOOGLE_CLIENT_ID'),
+    'redirect_uri': REDIRECT_URI,
+    'response_type': 'code',
+    'scope': ' '.join(SCOPES),
+    'access_type': 'offline',  # Request refresh token
+    'prompt': 'consent'  # Force consent screen to get refresh token
+})
+
+# Shared HTTP session for the manual OAuth calls - keep-alive avoids paying
+# a fresh TCP+TLS handshake for every token exchange/userinfo request
+_HTTP = requests.Session()
+_HTTP.mount('https://', requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=50))
+
+# OAuth callback page compiled once at import time. Values are injected as
+# JSON (see _json_for_script) rather than raw f-string interpolation, which
+# also closes the </script> injection hole via userinfo fields.
+_OAUTH_CALLBACK_TEMPLATE = Template('''
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Success</title>
+        <style>
+            body { font-family: Arial; padding: 40px; text-align: center; background: #f0f0f0; }
+            .success { color: #00cc00; font-size: 24px; }
+        </style>
+    </head>
+    <body>
+        <div class="success">✅ Authentication Successful!</div>
+        <p>This window will close automatically...</p>
+        <script>
+            console.log('OAuth callback: Sending message to parent...');
+            if (window.opener && !window.opener.closed) {
+                try {
+                    window.opener.postMessage({
+                        success: true,
+                        user: $user_json,
+                        accessToken: $access_token_json,
+                        credentials: $credentials_json
+                    }, '*');
+                    console.log('OAuth callback: Message sent successfully');
+
+                    // Close after message is sent
+                    setTimeout(() => {
+                        console.log('OAuth callback: Closing popup...');
+                        window.close();
+                    }, 1500);
+                } catch (e) {
+                    console.error('OAuth callback: Error sending message:', e);
+                }
+            } else {
+                console.log('OAuth callback: No opener window found');
+                document.body.innerHTML += '<p>Please close this window and return to the app.</p>';
+            }
+        </script>
+    </body>
+    </html>
+''')
+
+def _json_for_script(obj):
+    """Serialize a value for safe embedding inside a <script> block"""
+    return (json.dumps(obj, separators=(',', ':'))
+            .replace('<', '\\u003c')
+            .replace('>', '\\u003e')
+            .replace('&', '\\u0026')
+            .replace('\u2028', '\\u2028')
+            .replace('\u2029', '\\u2029'))
+
+# Deadline-type keywords and urgency buckets for upcoming-event
+# classification (first matching keyword wins; urgency via bisect on days)
+_TYPE_KEYWORDS = (
+    ('interview', 'interview'),
+    ('assessment', 'assessment'),
+    ('coding', 'assessment'),
+    ('application', 'application'),
+)
+_URGENCY_BUCKETS = [3, 7]  # days_until <= 3 -> high, <= 7 -> medium
+_URGENCY_LABELS = ['high', 'medium', 'low']
+
 # Global system instance
 email_system = None
 
+# Background executor for async email scans (poor man's task queue - keeps
+# the request path fast without requiring a broker on serverless hosting)
+_scan_executor = ThreadPoolExecutor(max_workers=4)
+_scan_tasks: Dict[str, Future] = {}
+
+# Redis-backed credential cache keyed per user. Shares OAuth tokens across
+# server instances (session cookies don't survive on serverless) and is a
+# no-op when REDIS_URL is not configured.
+_redis_client = None
+if REDIS_AVAILABLE and os.environ.get('REDIS_URL'):
+    try:
+        _redis_client = redis.Redis.from_url(os.environ['REDIS_URL'], decode_responses=True)
+        print("✅ Redis credential cache enabled")
+    except Exception as e:
+        print(f"⚠️ Redis connection failed: {e}")
+        _redis_client = None
+
+def _store_user_credentials(user_id, credentials_dict, ttl=3600):
+    """Cache a user's OAuth credentials in Redis under oauth:creds:{user_id}"""
+    if user_id:
+        # Fresh login - drop any stale memoized Credentials object
+        _credential_objects.pop(user_id, None)
+    if not _redis_client or not user_id:
+        return
+    try:
+        _redis_client.setex(f'oauth:creds:{user_id}', ttl, json.dumps(credentials_dict))
+    except Exception as e:
+        print(f"⚠️ Failed to cache credentials in Redis: {e}")
+
+# Live Credentials objects memoized per user so warm requests skip the
+# Redis read + JSON parse + reconstruction; refreshed in place on expiry
+_credential_objects: Dict[str, Credentials] = {}
+
+def _load_user_credentials(user_id):
+    """Load a user's cached OAuth credentials, reusing a live instance"""
+    if not user_id:
+        return None
+
+    credentials = _credential_objects.get(user_id)
+    if credentials is None:
+        if not _redis_client:
+            return None
+        try:
+            creds_json = _redis_client.get(f'oauth:creds:{user_id}')
+        except Exception as e:
+            print(f"⚠️ Failed to read credentials from Redis: {e}")
+            return None
+        if not creds_json:
+            return None
+        credentials = Credentials.from_authorized_user_info(json.loads(creds_json))
+        _credential_objects[user_id] = credentials
+
+    # Only refresh when actually expired instead of rebuilding every call
+    if credentials.expired and credentials.refresh_token:
+        from google.auth.transport.requests import Request
+        try:
+            credentials.refresh(Request())
+        except Exception as e:
+            print(f"⚠️ Cached credential refresh failed: {e}")
+            _credential_objects.pop(user_id, None)
+            return None
+
+    return credentials
+
 def get_credentials_from_session():
     """Get Google API credentials from session (Vercel-compatible)"""
     credentials_dict = session.get('credentials')
@@ -80,6 +288,24 @@ def get_credentials_from_session():
         return None
     return Credentials.from_authorized_user_info(credentials_dict)
 
+# Calendar API clients memoized per access token - building a discovery
+# client re-parses the discovery document every time, which costs tens of
+# milliseconds per request otherwise
+_calendar_services = {}
+
+def _get_calendar_service(credentials):
+    """Build (or reuse) a Calendar API client for the given credentials"""
+    from googleapiclient.discovery import build
+
+    service = _calendar_services.get(credentials.token)
+    if service is None:
+        service = build('calendar', 'v3', credentials=credentials,
+                        cache_discovery=False, static_discovery=True)
+        if len(_calendar_services) > 32:
+            _calendar_services.clear()  # Keep stale-token entries bounded
+        _calendar_services[credentials.token] = service
+    return service
+
 def init_system():
     """Initialize the email reminder system"""
     global email_system
@@ -132,20 +358,11 @@ def google_login():
     print(f"🔍 BACKEND_URL from env: {os.environ.get('BACKEND_URL', 'NOT SET')}")
     print(f"🔗 Using REDIRECT_URI: {REDIRECT_URI}")
     
-    # Build authorization URL manually
-    params = {
-        'client_id': os.environ.get('GOOGLE_CLIENT_ID'),
-        'redirect_uri': REDIRECT_URI,
-        'response_type': 'code',
-        'scope': ' '.join(SCOPES),
-        'state': state,
-        'access_type': 'offline',  # Request refresh token
-        'prompt': 'consent'  # Force consent screen to get refresh token
-    }
-    
-    auth_url = f"{GOOGLE_AUTH_URL}?{urllib.parse.urlencode(params)}"
+    # All static params are pre-encoded at import time; only the CSRF
+    # state varies per request
+    auth_url = f"{_AUTH_URL_PREFIX}&state={urllib.parse.quote(state, safe='')}"
     print(f"🔗 Redirecting to: {auth_url}")
-    
+
     return redirect(auth_url)
 
 @app.route('/auth/google/callback')
@@ -175,7 +392,7 @@ def google_callback():
         print(f"🔄 Exchanging authorization code for access token...")
         
         # Exchange code for token
-        token_response = requests.post(GOOGLE_TOKEN_URL, data=token_data)
+        token_response = _HTTP.post(GOOGLE_TOKEN_URL, data=token_data)
         token_response.raise_for_status()
         token = token_response.json()
         
@@ -194,7 +411,7 @@ def google_callback():
         
         # Get user info from Google
         headers = {'Authorization': f'Bearer {access_token}'}
-        userinfo_response = requests.get(GOOGLE_USERINFO_URL, headers=headers)
+        userinfo_response = _HTTP.get(GOOGLE_USERINFO_URL, headers=headers)
         userinfo_response.raise_for_status()
         user_info = userinfo_response.json()
         
@@ -219,72 +436,34 @@ def google_callback():
         # Store credentials in session (not on disk - Vercel filesystem is read-only)
         session['credentials'] = credentials_dict
         print("💾 Credentials stored in session (not writing to disk on Vercel)")
+
+        # Also cache them per-user in Redis so other instances can find them
+        _store_user_credentials(user_info.get('id'), credentials_dict, ttl=expires_in)
         
-        # Extract user info
-        email = user_info.get('email', '').replace('"', '&quot;')
-        name = user_info.get('name', '').replace('"', '&quot;')
-        picture = user_info.get('picture', '').replace('"', '&quot;')
-        user_id = user_info.get('id', '').replace('"', '&quot;')
-        
-        print(f"✅ Manual token exchange successful: {email}")
-        
-        # Get frontend URL from environment for postMessage
-        frontend_url = os.environ.get('FRONTEND_URL', 'http://localhost:3000').rstrip('/')
-        
-        return f'''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Success</title>
-                <style>
-                    body {{ font-family: Arial; padding: 40px; text-align: center; background: #f0f0f0; }}
-                    .success {{ color: #00cc00; font-size: 24px; }}
-                </style>
-            </head>
-            <body>
-                <div class="success">✅ Authentication Successful!</div>
-                <p>This window will close automatically...</p>
-                <script>
-                    console.log('OAuth callback: Sending message to parent...');
-                    if (window.opener && !window.opener.closed) {{
-                        try {{
-                            window.opener.postMessage({{
-                                success: true,
-                                user: {{
-                                    email: "{email}",
-                                    name: "{name}",
-                                    picture: "{picture}",
-                                    sub: "{user_id}"
-                                }},
-                                accessToken: "{access_token}",
-                                credentials: {{
-                                    token: "{access_token}",
-                                    refresh_token: "{token.get('refresh_token', '')}",
-                                    token_uri: "https://oauth2.googleapis.com/token",
-                                    client_id: "{os.environ.get('GOOGLE_CLIENT_ID', '')}",
-                                    client_secret: "{os.environ.get('GOOGLE_CLIENT_SECRET', '')}",
-                                    scopes: {json.dumps(token.get('scope', '').split())},
-                                    expiry_time: {expiry_timestamp}
-                                }}
-                            }}, '*');
-                            console.log('OAuth callback: Message sent successfully');
-                            
-                            // Close after message is sent
-                            setTimeout(() => {{
-                                console.log('OAuth callback: Closing popup...');
-                                window.close();
-                            }}, 1500);
-                        }} catch (e) {{
-                            console.error('OAuth callback: Error sending message:', e);
-                        }}
-                    }} else {{
-                        console.log('OAuth callback: No opener window found');
-                        document.body.innerHTML += '<p>Please close this window and return to the app.</p>';
-                    }}
-                </script>
-            </body>
-            </html>
-        '''
+        print(f"✅ Manual token exchange successful: {user_info.get('email', '')}")
+
+        # Render the precompiled callback page with JSON-escaped payloads
+        user_payload = {
+            'email': user_info.get('email', ''),
+            'name': user_info.get('name', ''),
+            'picture': user_info.get('picture', ''),
+            'sub': user_info.get('id', '')
+        }
+        credentials_payload = {
+            'token': access_token,
+            'refresh_token': token.get('refresh_token', ''),
+            'token_uri': 'https://oauth2.googleapis.com/token',
+            'client_id': os.environ.get('GOOGLE_CLIENT_ID', ''),
+            'client_secret': os.environ.get('GOOGLE_CLIENT_SECRET', ''),
+            'scopes': token.get('scope', '').split(),
+            'expiry_time': expiry_timestamp
+        }
+
+        return _OAUTH_CALLBACK_TEMPLATE.substitute(
+            user_json=_json_for_script(user_payload),
+            access_token_json=_json_for_script(access_token),
+            credentials_json=_json_for_script(credentials_payload)
+        )
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -454,6 +633,364 @@ def setup_user_credentials():
             "traceback": traceback.format_exc()
         }), 500
 
+def _format_scan_result(result, existing_titles, result_index):
+    """
+    Filter and format one analysis result for the API response.
+
+    Returns (formatted_result, skip_reason); formatted_result is None when
+    the email was filtered out and skip_reason is one of 'no_deadline',
+    'expired', 'duplicate' or 'processed'.
+    """
+    email_data = result.get('email_data', {})
+    classification = result.get('classification', {})
+    deadline_info = result.get('deadline_info', {})
+    calendar_event = result.get('calendar_event')
+
+    # Skip emails without deadlines
+    if not deadline_info or not deadline_info.get('has_deadline'):
+        return None, 'no_deadline'
+
+    # Skip expired deadlines (past dates)
+    deadline_date = deadline_info.get('deadline_date')
+    if not _is_future_deadline(deadline_date):
+        print(f"⏭️ Skipping expired deadline for: {email_data.get('subject', '')[:50]}...")
+        return None, 'expired'
+
+    # Skip duplicates already in Google Calendar - improved matching
+    subject = email_data.get('subject', '').strip().lower()
+    # Normalize subject: remove common prefixes, special chars
+    normalized_subject = subject.replace('fwd:', '').replace('re:', '').replace('📧', '').strip()
+    # Check multiple matching strategies for duplicates
+    for existing in existing_titles:
+        normalized_existing = existing.replace('📧', '').strip()
+        # Exact match
+        if normalized_subject == normalized_existing:
+            break
+        # Subject contained in existing event title
+        if len(normalized_subject) > 10 and normalized_subject in normalized_existing:
+            break
+        # Existing event title contained in subject
+        if len(normalized_existing) > 10 and normalized_existing in normalized_subject:
+            break
+    else:
+        existing = None
+    if existing is not None:
+        print(f"🔄 Skipping duplicate (already in calendar): {email_data.get('subject', '')[:50]}...")
+        return None, 'duplicate'
+
+    # Skip emails with duplicate or rejected calendar events (from processing)
+    if calendar_event and calendar_event.get('status') in ['duplicate', 'rejected']:
+        return None, 'processed'
+
+    formatted_result = {
+        "email_id": email_data.get('id', 'sample_' + str(result_index)),
+        "subject": email_data.get('subject', ''),
+        "sender": email_data.get('sender', ''),
+        "date": email_data.get('date', ''),
+        # The parser blanks snippet once a full body is extracted, so the
+        # key exists but may be empty - `or` falls through, .get() wouldn't
+        "snippet": email_data.get('snippet') or email_data.get('body', '')[:200],
+        "classification": {
+            "is_job_related": classification.get('is_job_related', False),
+            "category": classification.get('category', 'other'),
+            "urgency": classification.get('urgency', 'low'),
+            "confidence": classification.get('confidence', 0.8),
+            "reasoning": classification.get('reason', classification.get('reasoning', ''))
+        },
+        "deadline": {
+            "has_deadline": True,
+            "date": deadline_info.get('deadline_date'),
+            "time": deadline_info.get('deadline_time'),
+            "type": deadline_info.get('deadline_type'),
+            "description": deadline_info.get('description'),
+            "text": deadline_info.get('deadline_text'),
+            "urgency_days": _calculate_urgency_days(deadline_info.get('deadline_date'))
+        }
+    }
+    return formatted_result, None
+
+def _stream_email_scan(user_id, credentials, max_emails, days_back, search_query):
+    """
+    Generator variant of _perform_email_scan that yields NDJSON lines.
+
+    Each formatted email is emitted as soon as it clears the filters, so
+    large scans get a low time-to-first-byte and the response is never
+    materialized as one list. The final line is the summary record.
+    Streaming mode reports analysis only - calendar events are created by
+    the synchronous path or via /api/calendar/reminders.
+    """
+    from gmail_integration import GmailIntegrator
+    email_system.gmail = GmailIntegrator(credentials=credentials)
+
+    print(f"📧 Streaming email scan for user: {user_id}")
+    # Lazy pipeline: each analysis window is yielded as it completes, so
+    # the first NDJSON line goes out after one fetch+analyze window and
+    # the scan's results are never held as a single list
+    results = email_system.iter_process_user_emails(
+        user_id=user_id,
+        max_emails=max_emails,
+        days_back=days_back,
+        search_query=search_query
+    )
+
+    existing_titles = _get_existing_calendar_events(credentials_override=credentials)
+
+    scanned_count = 0
+    skipped_count = 0
+    expired_count = 0
+    duplicate_count = 0
+    job_related_count = 0
+    emitted = 0
+
+    for result in results:
+        scanned_count += 1
+        formatted_result, skip_reason = _format_scan_result(result, existing_titles, emitted)
+        if formatted_result is None:
+            skipped_count += 1
+            if skip_reason == 'expired':
+                expired_count += 1
+            elif skip_reason == 'duplicate':
+                duplicate_count += 1
+            continue
+        job_related_count += int(formatted_result['classification']['is_job_related'])
+        emitted += 1
+        yield json.dumps(formatted_result) + '\n'
+
+    yield json.dumps({
+        "summary": {
+            "total_emails_scanned": scanned_count,
+            "new_reminders_ready": emitted,
+            "job_related_emails": job_related_count,
+            "expired_filtered": expired_count,
+            "duplicates_filtered": duplicate_count,
+            "total_filtered": skipped_count
+        }
+    }) + '\n'
+
+def _acquire_scan_lock(user_id):
+    """Try to take the per-user single-flight scan lock (120s safety TTL)"""
+    if not _redis_client:
+        return True
+    try:
+        return bool(_redis_client.set(f'scan:lock:{user_id}', '1', nx=True, ex=120))
+    except Exception as e:
+        print(f"⚠️ Scan lock unavailable: {e}")
+        return True
+
+def _release_scan_lock(user_id):
+    if not _redis_client:
+        return
+    try:
+        _redis_client.delete(f'scan:lock:{user_id}')
+    except Exception as e:
+        print(f"⚠️ Scan lock release failed: {e}")
+
+def _cache_scan_result(user_id, payload):
+    """Keep the latest scan payload briefly so concurrent callers reuse it"""
+    if not _redis_client:
+        return
+    try:
+        _redis_client.setex(f'scan:result:{user_id}', 60, json.dumps(payload))
+    except Exception as e:
+        print(f"⚠️ Scan result cache write failed: {e}")
+
+def _run_scan_with_lock(user_id, credentials, max_emails, days_back, search_query):
+    """Run a scan, then release the user's lock and cache the result"""
+    try:
+        payload = _perform_email_scan(
+            user_id, credentials, max_emails, days_back, search_query
+        )
+    finally:
+        _release_scan_lock(user_id)
+    _cache_scan_result(user_id, payload)
+    return payload
+
+def _perform_email_scan(user_id, credentials, max_emails, days_back, search_query):
+    """
+    Run the Gmail scan + analysis pipeline and build the API response payload.
+
+    Shared by the synchronous scan path and the background executor;
+    raises on failure so callers can map errors to HTTP responses.
+    """
+    # Set credentials for Gmail service
+    from gmail_integration import GmailIntegrator
+    email_system.gmail = GmailIntegrator(credentials=credentials)
+    
+    # Fetch and process real emails from user's Gmail account
+    print(f"📧 Attempting to process emails for user: {user_id}")
+    results = email_system.process_user_emails(
+        user_id=user_id,
+        max_emails=max_emails,
+        days_back=days_back,
+        search_query=search_query
+    )
+    print(f"✅ Successfully processed {len(results)} emails from Gmail")
+    
+    # Format results for API response (filter out duplicates, rejected items, and no-deadline emails)
+    formatted_results = []
+    skipped_count = 0
+    expired_count = 0
+    duplicate_count = 0
+    job_related_count = 0
+    new_reminders_ready = 0
+    
+    # Load existing calendar events once for duplicate detection (pass credentials)
+    existing_titles = _get_existing_calendar_events(credentials_override=credentials)
+    
+    for result in results:
+        formatted_result, skip_reason = _format_scan_result(
+            result, existing_titles, len(formatted_results)
+        )
+        if formatted_result is None:
+            skipped_count += 1
+            if skip_reason == 'expired':
+                expired_count += 1
+            elif skip_reason == 'duplicate':
+                duplicate_count += 1
+            continue
+
+        # Count while building - avoids re-walking formatted_results below
+        job_related_count += int(formatted_result['classification']['is_job_related'])
+        new_reminders_ready += int(formatted_result['deadline']['has_deadline'])
+        formatted_results.append(formatted_result)
+
+    print(f"📊 Filtering summary:")
+    print(f"   ⏭️  Expired deadlines: {expired_count}")
+    print(f"   🔄 Duplicates (in calendar): {duplicate_count}")
+    print(f"   ❌ Total filtered: {skipped_count}")
+    print(f"   ✅ New reminders to show: {len(formatted_results)}")
+    
+    # 🎯 AUTO-CREATE CALENDAR EVENTS for new reminders
+    calendar_events_created = 0
+    try:
+        # Get calendar service - use same credentials as Gmail scan
+        calendar_credentials = credentials  # Reuse the credentials we already have from above
+        print(f"🔑 Using existing credentials for calendar event creation")
+        
+        if calendar_credentials:
+            from googleapiclient.discovery import build
+            from google.auth.transport.requests import Request
+            
+            # Refresh token if expired
+            if calendar_credentials.expired and calendar_credentials.refresh_token:
+                calendar_credentials.refresh(Request())
+            
+            calendar_service = _get_calendar_service(calendar_credentials)
+            print(f"📅 Calendar service ready - creating events for {len(formatted_results)} reminders...")
+
+            user_timezone = os.getenv('DEFAULT_TIMEZONE', 'Asia/Kolkata')
+            insert_jobs = []
+            for result in formatted_results:
+                if not result['deadline']['has_deadline']:
+                    continue
+
+                try:
+                    deadline_date = result['deadline']['date']
+                    deadline_time = result['deadline'].get('time') or '23:59:00'
+                    deadline_dt = datetime.fromisoformat(f"{deadline_date}T{deadline_time}")
+
+                    # Create calendar event
+                    event_body = {
+                        'summary': f"📧 {result['subject'][:100]}",
+                        'description': f"From: {result['sender']}\n\n{result['deadline'].get('description') or result['snippet']}",
+                        'start': {
+                            'dateTime': deadline_dt.isoformat(),
+                            'timeZone': user_timezone
+                        },
+                        'end': {
+                            'dateTime': deadline_dt.isoformat(),
+                            'timeZone': user_timezone
+                        },
+                        'reminders': {
+                            'useDefault': False,
+                            'overrides': [
+                                {'method': 'email', 'minutes': 10080},  # 1 week
+                                {'method': 'popup', 'minutes': 1440},   # 1 day
+                                {'method': 'popup', 'minutes': 60}      # 1 hour
+                            ]
+                        },
+                        'colorId': '11',  # Red for urgency
+                        'extendedProperties': {
+                            'shared': {
+                                'senderEmail': result['sender'],
+                                'urgency': result.get('urgency', 'medium'),
+                                'type': result.get('type', 'other')
+                            }
+                        }
+                    }
+                    insert_jobs.append((result, event_body))
+                except Exception as e:
+                    print(f"⚠️ Failed to create calendar event for '{result['subject'][:50]}': {e}")
+
+            # The inserts are independent RPCs, so overlap them on a bounded
+            # thread pool - each call releases the GIL during network I/O.
+            # The shared service's httplib2 transport is not thread-safe,
+            # so each worker gets its own AuthorizedHttp (same pattern as
+            # gmail_integration._fetch_messages_threaded)
+            import threading
+            local = threading.local()
+
+            def _get_http():
+                if getattr(local, 'http', None) is None:
+                    import httplib2
+                    import google_auth_httplib2
+                    local.http = google_auth_httplib2.AuthorizedHttp(
+                        calendar_credentials, http=httplib2.Http()
+                    )
+                return local.http
+
+            def _insert_event(body):
+                return calendar_service.events().insert(
+                    calendarId='primary',
+                    body=body
+                ).execute(http=_get_http())
+
+            if insert_jobs:
+                from concurrent.futures import as_completed
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    futures = {
+                        executor.submit(_insert_event, body): result
+                        for result, body in insert_jobs
+                    }
+                    for future in as_completed(futures):
+                        result = futures[future]
+                        try:
+                            future.result()
+                            calendar_events_created += 1
+                            print(f"✅ Created calendar event: {result['subject'][:50]}")
+                        except Exception as e:
+                            print(f"⚠️ Failed to create calendar event for '{result['subject'][:50]}': {e}")
+            
+            print(f"🎉 Successfully created {calendar_events_created}/{len(formatted_results)} calendar events!")
+        else:
+            print("⚠️ No calendar credentials available - skipping calendar event creation")
+            
+    except Exception as e:
+        print(f"❌ Calendar event creation error: {e}")
+    
+    return {
+        "success": True,
+        "scan_timestamp": datetime.now().isoformat(),
+        "user_id": user_id,
+        "summary": {
+            "total_emails_scanned": len(results),
+            "valid_future_deadlines": new_reminders_ready,
+            "new_reminders_ready": new_reminders_ready,
+            "calendar_events_created": calendar_events_created,
+            "job_related_emails": job_related_count,
+            "expired_filtered": expired_count,
+            "duplicates_filtered": duplicate_count,
+            "total_filtered": skipped_count,
+            "upcoming_only": True,
+            "scan_parameters": {
+                "max_emails": max_emails,
+                "days_back": days_back,
+                "search_query": search_query
+            }
+        },
+        "emails": formatted_results
+    }
+
 @app.route('/api/emails/scan', methods=['POST'])
 def scan_emails():
     """
@@ -488,7 +1025,11 @@ def scan_emails():
         
         # Try to get credentials from session first
         credentials = get_credentials_from_session()
-        
+
+        # Next try the Redis credential cache (shared across instances)
+        if not credentials:
+            credentials = _load_user_credentials(user_id)
+
         # If no session credentials, try to use full credentials from request
         if not credentials and credentials_dict:
             print(f"🔑 No session credentials, using full credentials from request")
@@ -558,220 +1099,53 @@ def scan_emails():
                 "error": "Email system not initialized"
             }), 500
         
-        # Set credentials for Gmail service
-        from gmail_integration import GmailIntegrator
-        email_system.gmail = GmailIntegrator(credentials=credentials)
-        
-        # Fetch and process real emails from user's Gmail account
-        print(f"📧 Attempting to process emails for user: {user_id}")
-        results = email_system.process_user_emails(
-            user_id=user_id,
-            max_emails=max_emails,
-            days_back=days_back,
-            search_query=search_query
-        )
-        print(f"✅ Successfully processed {len(results)} emails from Gmail")
-        
-        # Format results for API response (filter out duplicates, rejected items, and no-deadline emails)
-        formatted_results = []
-        skipped_count = 0
-        expired_count = 0
-        duplicate_count = 0
-        
-        # Load existing calendar events once for duplicate detection (pass credentials)
-        existing_titles = _get_existing_calendar_events(credentials_override=credentials)
-        
-        for result in results:
-            email_data = result.get('email_data', {})
-            classification = result.get('classification', {})
-            deadline_info = result.get('deadline_info', {})
-            calendar_event = result.get('calendar_event')
-            
-            # Skip emails without deadlines
-            if not deadline_info or not deadline_info.get('has_deadline'):
-                skipped_count += 1
-                continue
-            
-            # Skip expired deadlines (past dates)
-            deadline_date = deadline_info.get('deadline_date')
-            if not _is_future_deadline(deadline_date):
-                print(f"⏭️ Skipping expired deadline for: {email_data.get('subject', '')[:50]}...")
-                expired_count += 1
-                skipped_count += 1
-                continue
-            
-            # Skip duplicates already in Google Calendar - improved matching
-            subject = email_data.get('subject', '').strip().lower()
-            # Normalize subject: remove common prefixes, special chars
-            normalized_subject = subject.replace('fwd:', '').replace('re:', '').replace('📧', '').strip()
-            # Check multiple matching strategies for duplicates
-            is_duplicate = False
-            for existing in existing_titles:
-                normalized_existing = existing.replace('📧', '').strip()
-                # Exact match
-                if normalized_subject == normalized_existing:
-                    is_duplicate = True
-                    break
-                # Subject contained in existing event title
-                if len(normalized_subject) > 10 and normalized_subject in normalized_existing:
-                    is_duplicate = True
-                    break
-                # Existing event title contained in subject
-                if len(normalized_existing) > 10 and normalized_existing in normalized_subject:
-                    is_duplicate = True
-                    break
-            if is_duplicate:
-                print(f"🔄 Skipping duplicate (already in calendar): {email_data.get('subject', '')[:50]}...")
-                duplicate_count += 1
-                skipped_count += 1
-                continue
-            
-            # Skip emails with duplicate or rejected calendar events (from processing)
-            if calendar_event:
-                status = calendar_event.get('status')
-                if status in ['duplicate', 'rejected']:
-                    skipped_count += 1
-                    continue
-            
-            formatted_result = {
-                "email_id": email_data.get('id', 'sample_' + str(len(formatted_results))),
-                "subject": email_data.get('subject', ''),
-                "sender": email_data.get('sender', ''),
-                "date": email_data.get('date', ''),
-                "snippet": email_data.get('snippet', email_data.get('body', '')[:200]),
-                "classification": {
-                    "is_job_related": classification.get('is_job_related', False),
-                    "category": classification.get('category', 'other'),
-                    "urgency": classification.get('urgency', 'low'),
-                    "confidence": classification.get('confidence', 0.8),
-                    "reasoning": classification.get('reason', classification.get('reasoning', ''))
-                },
-                "deadline": None
-            }
-            
-            # Add deadline information if present
-            if deadline_info and deadline_info.get('has_deadline'):
-                formatted_result["deadline"] = {
-                    "has_deadline": True,
-                    "date": deadline_info.get('deadline_date'),
-                    "time": deadline_info.get('deadline_time'),
-                    "type": deadline_info.get('deadline_type'),
-                    "description": deadline_info.get('description'),
-                    "text": deadline_info.get('deadline_text'),
-                    "urgency_days": _calculate_urgency_days(deadline_info.get('deadline_date'))
-                }
-            else:
-                formatted_result["deadline"] = {"has_deadline": False}
-            
-            formatted_results.append(formatted_result)
-        
-        print(f"📊 Filtering summary:")
-        print(f"   ⏭️  Expired deadlines: {expired_count}")
-        print(f"   🔄 Duplicates (in calendar): {duplicate_count}")
-        print(f"   ❌ Total filtered: {skipped_count}")
-        print(f"   ✅ New reminders to show: {len(formatted_results)}")
-        
-        # 🎯 AUTO-CREATE CALENDAR EVENTS for new reminders
-        calendar_events_created = 0
-        try:
-            # Get calendar service - use same credentials as Gmail scan
-            calendar_credentials = credentials  # Reuse the credentials we already have from above
-            print(f"🔑 Using existing credentials for calendar event creation")
-            
-            if calendar_credentials:
-                from googleapiclient.discovery import build
-                from google.auth.transport.requests import Request
-                
-                # Refresh token if expired
-                if calendar_credentials.expired and calendar_credentials.refresh_token:
-                    calendar_credentials.refresh(Request())
-                
-                calendar_service = build('calendar', 'v3', credentials=calendar_credentials)
-                print(f"📅 Calendar service ready - creating events for {len(formatted_results)} reminders...")
-                
-                for result in formatted_results:
-                    if not result['deadline']['has_deadline']:
-                        continue
-                    
-                    try:
-                        deadline_date = result['deadline']['date']
-                        deadline_time = result['deadline'].get('time') or '23:59:00'
-                        deadline_dt = datetime.fromisoformat(f"{deadline_date}T{deadline_time}")
-                        
-                        # Create calendar event
-                        event_body = {
-                            'summary': f"📧 {result['subject'][:100]}",
-                            'description': f"From: {result['sender']}\n\n{result['deadline'].get('description', result['snippet'])}",
-                            'start': {
-                                'dateTime': deadline_dt.isoformat(),
-                                'timeZone': os.getenv('DEFAULT_TIMEZONE', 'Asia/Kolkata')
-                            },
-                            'end': {
-                                'dateTime': deadline_dt.isoformat(),
-                                'timeZone': os.getenv('DEFAULT_TIMEZONE', 'Asia/Kolkata')
-                            },
-                            'reminders': {
-                                'useDefault': False,
-                                'overrides': [
-                                    {'method': 'email', 'minutes': 10080},  # 1 week
-                                    {'method': 'popup', 'minutes': 1440},   # 1 day
-                                    {'method': 'popup', 'minutes': 60}      # 1 hour
-                                ]
-                            },
-                            'colorId': '11',  # Red for urgency
-                            'extendedProperties': {
-                                'shared': {
-                                    'senderEmail': result['sender'],
-                                    'urgency': result.get('urgency', 'medium'),
-                                    'type': result.get('type', 'other')
-                                }
-                            }
-                        }
-                        
-                        event = calendar_service.events().insert(
-                            calendarId='primary',
-                            body=event_body
-                        ).execute()
-                        
-                        calendar_events_created += 1
-                        print(f"✅ Created calendar event: {result['subject'][:50]}")
-                        
-                    except Exception as e:
-                        print(f"⚠️ Failed to create calendar event for '{result['subject'][:50]}': {e}")
-                
-                print(f"🎉 Successfully created {calendar_events_created}/{len(formatted_results)} calendar events!")
-            else:
-                print("⚠️ No calendar credentials available - skipping calendar event creation")
-                
-        except Exception as e:
-            print(f"❌ Calendar event creation error: {e}")
-        
-        # Calculate summary statistics based on actual valid results
-        job_related_count = sum(1 for r in formatted_results if r['classification']['is_job_related'])
-        new_reminders_ready = sum(1 for r in formatted_results if r['deadline']['has_deadline'])
-        
-        return jsonify({
-            "success": True,
-            "scan_timestamp": datetime.now().isoformat(),
-            "user_id": user_id,
-            "summary": {
-                "total_emails_scanned": len(results),
-                "valid_future_deadlines": new_reminders_ready,
-                "new_reminders_ready": new_reminders_ready,
-                "calendar_events_created": calendar_events_created,
-                "job_related_emails": job_related_count,
-                "expired_filtered": expired_count,
-                "duplicates_filtered": duplicate_count,
-                "total_filtered": skipped_count,
-                "upcoming_only": True,
-                "scan_parameters": {
-                    "max_emails": max_emails,
-                    "days_back": days_back,
-                    "search_query": search_query
-                }
-            },
-            "emails": formatted_results
-        })
+        # Optionally stream results as NDJSON - entries arrive as the backend
+        # produces them instead of after the whole scan finishes.
+        if data.get('stream'):
+            return Response(
+                stream_with_context(_stream_email_scan(
+                    user_id, credentials, max_emails, days_back, search_query
+                )),
+                mimetype='application/x-ndjson'
+            )
+
+        # Single-flight guard: when Redis is configured, concurrent scans for
+        # the same user collapse into one - later callers get the last cached
+        # payload (or a 429) instead of hammering Gmail with duplicate work.
+        if not _acquire_scan_lock(user_id):
+            cached = None
+            try:
+                cached = _redis_client.get(f'scan:result:{user_id}')
+            except Exception as e:
+                print(f"⚠️ Scan result cache read failed: {e}")
+            if cached:
+                print(f"🔁 Scan already in progress for {user_id}, serving cached result")
+                return app.response_class(cached, mimetype='application/json')
+            return jsonify({
+                "success": False,
+                "error": "scan_in_progress",
+                "message": "An email scan is already running for this user. Please retry shortly."
+            }), 429
+
+        # Optionally run the scan in the background so the request returns
+        # immediately; poll /api/emails/scan/status/<task_id> for the result.
+        if data.get('async'):
+            task_id = uuid.uuid4().hex
+            _scan_tasks[task_id] = _scan_executor.submit(
+                _run_scan_with_lock, user_id, credentials,
+                max_emails, days_back, search_query
+            )
+            print(f"🚀 Scan queued in background: task {task_id}")
+            return jsonify({
+                "success": True,
+                "task_id": task_id,
+                "status": "pending",
+                "status_url": f"/api/emails/scan/status/{task_id}"
+            }), 202
+
+        return jsonify(_run_scan_with_lock(
+            user_id, credentials, max_emails, days_back, search_query
+        ))
         
     except Exception as e:
         error_message = str(e)
@@ -799,6 +1173,47 @@ def scan_emails():
                 "traceback": traceback.format_exc()
             }), 500
 
+@app.route('/api/emails/scan/status/<task_id>', methods=['GET'])
+def get_scan_status(task_id):
+    """
+    Poll the status of a background email scan started with {"async": true}
+
+    Path parameter:
+    - task_id: Task identifier returned by POST /api/emails/scan
+    """
+    future = _scan_tasks.get(task_id)
+    if future is None:
+        return jsonify({
+            "success": False,
+            "error": "Unknown task_id"
+        }), 404
+
+    if not future.done():
+        return jsonify({
+            "success": True,
+            "task_id": task_id,
+            "status": "running"
+        })
+
+    _scan_tasks.pop(task_id, None)
+    try:
+        result = future.result()
+    except Exception as e:
+        print(f"❌ Background scan failed: {e}")
+        return jsonify({
+            "success": False,
+            "task_id": task_id,
+            "status": "failed",
+            "error": str(e)
+        }), 500
+
+    return jsonify({
+        "success": True,
+        "task_id": task_id,
+        "status": "completed",
+        "result": result
+    })
+
 @app.route('/api/calendar/reminders', methods=['POST'])
 def create_calendar_reminders():
     """
@@ -818,7 +1233,8 @@ def create_calendar_reminders():
     try:
         from googleapiclient.discovery import build
         from google.auth.transport.requests import Request
-        
+        from datetime import datetime as dt, timedelta
+
         data = request.get_json()
         user_id = data.get('user_id')
         emails = data.get('emails', [])
@@ -834,6 +1250,8 @@ def create_calendar_reminders():
         # Load calendar credentials from session (Vercel-compatible)
         try:
             credentials = get_credentials_from_session()
+            if not credentials:
+                credentials = _load_user_credentials(user_id)
             if not credentials:
                 print("⚠️ No credentials in session - cannot sync to calendar")
                 return jsonify({
@@ -852,15 +1270,26 @@ def create_calendar_reminders():
                 session['credentials']['token'] = credentials.token
             
             # Build Calendar API service
-            calendar_service = build('calendar', 'v3', credentials=credentials)
+            calendar_service = _get_calendar_service(credentials)
             
             created_events = []
             failed_events = []
             skipped_events = []
             duplicate_events = []
+            pending_inserts = []
             
             print(f"📅 Processing {len(emails)} emails for calendar sync...")
-            
+
+            # Get user's timezone from environment or default to Asia/Kolkata (India)
+            # (read once per request - it's the same for every event)
+            user_timezone = os.environ.get('DEFAULT_TIMEZONE', 'Asia/Kolkata')
+
+            # Reminder preferences are fixed per request - build the overrides once
+            default_reminders_list = [
+                {'method': 'popup', 'minutes': min_before}
+                for min_before in reminder_prefs.get('default_reminders', [1440, 60])
+            ]
+
             for email in emails:
                 try:
                     email_id = email.get('email_id')
@@ -881,7 +1310,6 @@ def create_calendar_reminders():
                     
                     # Check for duplicates before creating event
                     if deadline_date:
-                        from datetime import timedelta
                         try:
                             deadline_dt_check = dt.fromisoformat(deadline_date)
                             time_min = (deadline_dt_check - timedelta(days=1)).isoformat() + 'Z'
@@ -895,23 +1323,34 @@ def create_calendar_reminders():
                                 singleEvents=True
                             ).execute().get('items', [])
                             
-                            # Simple duplicate check
-                            subject_words = set(subject.lower().split())
+                            # Simple duplicate check (skip stopword-length tokens)
+                            subject_lower = subject.lower()
+                            subject_words = frozenset(w for w in subject_lower.split() if len(w) > 2)
+                            # With 1-2 meaningful tokens the 70% word-overlap rule degenerates
+                            # (a single shared word matches almost anything), so require at
+                            # least 2 common words and fall back to exact-title equality
+                            # for very short subjects.
+                            use_exact_match = len(subject_words) < 3
+                            min_common = max(2, int(len(subject_words) * 0.7))
                             is_duplicate = False
                             for existing in existing_events:
                                 existing_title = existing.get('summary', '').lower()
-                                existing_words = set(existing_title.split())
-                                common = subject_words.intersection(existing_words)
-                                
-                                if len(common) >= len(subject_words) * 0.7:
-                                    print(f"     🔄 Duplicate found: {existing.get('summary')}")
-                                    duplicate_events.append({
-                                        "email_id": email_id,
-                                        "existing_event_id": existing['id'],
-                                        "reason": "similar_event_exists"
-                                    })
-                                    is_duplicate = True
-                                    break
+                                if use_exact_match:
+                                    if existing_title.strip() != subject_lower.strip():
+                                        continue
+                                else:
+                                    existing_words = set(existing_title.split())
+                                    common = subject_words.intersection(existing_words)
+                                    if len(common) < min_common:
+                                        continue
+                                print(f"     🔄 Duplicate found: {existing.get('summary')}")
+                                duplicate_events.append({
+                                    "email_id": email_id,
+                                    "existing_event_id": existing['id'],
+                                    "reason": "similar_event_exists"
+                                })
+                                is_duplicate = True
+                                break
                             
                             if is_duplicate:
                                 continue
@@ -923,17 +1362,13 @@ def create_calendar_reminders():
                         deadline_time = '23:59:00'
                     
                     # Combine date and time, treat as local timezone
-                    from datetime import datetime as dt
                     deadline_str = f"{deadline_date}T{deadline_time}"
                     deadline_dt = dt.fromisoformat(deadline_str.replace('Z', ''))
-                    
-                    # Get user's timezone from environment or default to Asia/Kolkata (India)
-                    user_timezone = os.environ.get('DEFAULT_TIMEZONE', 'Asia/Kolkata')
-                    
+
                     # Create event in user's local timezone (don't convert to UTC)
                     event_body = {
                         'summary': f'📧 Job Deadline: {subject[:100]}',
-                        'description': f'{deadline.get("description", "")}\n\nEmail: {email.get("snippet", "")}',
+                        'description': f'{deadline.get("description", "")}\n\nEmail: {email.get("snippet") or email.get("body", "")[:200]}',
                         'start': {
                             'dateTime': deadline_dt.isoformat(),
                             'timeZone': user_timezone,
@@ -944,39 +1379,70 @@ def create_calendar_reminders():
                         },
                         'reminders': {
                             'useDefault': False,
-                            'overrides': [
-                                {'method': 'popup', 'minutes': min_before}
-                                for min_before in reminder_prefs.get('default_reminders', [1440, 60])
-                            ],
+                            'overrides': default_reminders_list,
                         },
                         'colorId': '11',  # Red for urgent deadlines
                     }
                     
-                    # Create event in Google Calendar
-                    event = calendar_service.events().insert(
-                        calendarId='primary',
-                        body=event_body
-                    ).execute()
-                    
-                    created_events.append({
-                        "event_id": event['id'],
+                    # Queue the insert - executed below in batched requests
+                    pending_inserts.append({
                         "email_id": email_id,
-                        "title": subject,
+                        "subject": subject,
                         "start_time": deadline_dt.isoformat(),
-                        "calendar_link": event.get('htmlLink'),
-                        "status": "synced_to_google_calendar"
+                        "body": event_body
                     })
-                    
-                    print(f"✅ Created Google Calendar event: {subject}")
-                    print(f"   📍 Event ID: {event['id']}")
-                    print(f"   🔗 Link: {event.get('htmlLink')}")
-                    
+
                 except Exception as e:
                     print(f"❌ Failed to create event for {email.get('subject')}: {e}")
                     import traceback
                     traceback.print_exc()
                     failed_events.append({"email_id": email_id, "error": str(e)})
-            
+
+            # Ship the queued inserts as multipart batch requests (50 per
+            # batch - the Calendar API limit) instead of paying one HTTPS
+            # round trip per event.
+            def _on_event_created(request_id, response, exception):
+                pending = pending_inserts[int(request_id)]
+                if exception is not None:
+                    print(f"❌ Failed to create event for {pending['subject']}: {exception}")
+                    failed_events.append({
+                        "email_id": pending['email_id'],
+                        "error": str(exception)
+                    })
+                    return
+                created_events.append({
+                    "event_id": response['id'],
+                    "email_id": pending['email_id'],
+                    "title": pending['subject'],
+                    "start_time": pending['start_time'],
+                    "calendar_link": response.get('htmlLink'),
+                    "status": "synced_to_google_calendar"
+                })
+                print(f"✅ Created Google Calendar event: {pending['subject']}")
+                print(f"   📍 Event ID: {response['id']}")
+                print(f"   🔗 Link: {response.get('htmlLink')}")
+
+            for batch_start in range(0, len(pending_inserts), 50):
+                batch = calendar_service.new_batch_http_request(callback=_on_event_created)
+                for idx in range(batch_start, min(batch_start + 50, len(pending_inserts))):
+                    batch.add(
+                        calendar_service.events().insert(
+                            calendarId='primary',
+                            body=pending_inserts[idx]['body']
+                        ),
+                        request_id=str(idx)
+                    )
+                batch.execute()
+
+            # New events were just created - drop this user's cached
+            # upcoming-events responses so they show up immediately
+            if _redis_client and created_events:
+                try:
+                    for key in _redis_client.scan_iter(f'upcoming:{user_id}:*'):
+                        _redis_client.delete(key)
+                except Exception as e:
+                    print(f"⚠️ Upcoming-events cache invalidation failed: {e}")
+
             print(f"\n📊 Calendar Sync Summary:")
             print(f"   ✅ Created: {len(created_events)}")
             print(f"   🔄 Duplicates: {len(duplicate_events)}")
@@ -1082,7 +1548,11 @@ def delete_calendar_reminder(event_id):
         # Get credentials from request (Vercel-compatible)
         try:
             credentials = get_credentials_from_session()
-            
+
+            # Next try the Redis credential cache (shared across instances)
+            if not credentials:
+                credentials = _load_user_credentials(user_id)
+
             # Try full credentials from request
             if not credentials and credentials_json:
                 print(f"🔑 Using credentials from request")
@@ -1131,7 +1601,7 @@ def delete_calendar_reminder(event_id):
                 }), 401
             
             # Build Calendar API service
-            calendar_service = build('calendar', 'v3', credentials=credentials)
+            calendar_service = _get_calendar_service(credentials)
             
             # Try deleting the event from Google Calendar
             try:
@@ -1199,6 +1669,19 @@ def get_upcoming_reminders():
                 "error": "user_id is required"
             }), 400
         
+        # Serve from the short-TTL cache when possible - calendar data changes
+        # on the order of minutes, so skip the Google round trip per request
+        cache_key = f'upcoming:{user_id}:{days_ahead}'
+        if _redis_client:
+            try:
+                cached = _redis_client.get(cache_key)
+            except Exception as e:
+                print(f"⚠️ Upcoming-events cache read failed: {e}")
+                cached = None
+            if cached:
+                print(f"⚡ Serving upcoming events from cache for user: {user_id}")
+                return app.response_class(cached, mimetype='application/json')
+
         print(f"📅 Fetching upcoming events for user: {user_id}")
         print(f"🔍 Session credentials available: {session.get('credentials') is not None}")
         print(f"🔑 Access token provided: {bool(access_token)}")
@@ -1210,7 +1693,11 @@ def get_upcoming_reminders():
             from google.auth.transport.requests import Request
             
             credentials = get_credentials_from_session()
-            
+
+            # Next try the Redis credential cache (shared across instances)
+            if not credentials:
+                credentials = _load_user_credentials(user_id)
+
             # If no session credentials, try to use credentials from request
             if not credentials and credentials_json:
                 print(f"🔑 No session credentials, using full credentials from request")
@@ -1277,57 +1764,57 @@ def get_upcoming_reminders():
                 }), 200
             
             # Build Calendar API service
-            calendar_service = build('calendar', 'v3', credentials=credentials)
+            calendar_service = _get_calendar_service(credentials)
             
             # Get events from Google Calendar
             from datetime import datetime, timedelta
             now = datetime.utcnow().isoformat() + 'Z'
             end_date = (datetime.utcnow() + timedelta(days=days_ahead)).isoformat() + 'Z'
             
-            events_result = calendar_service.events().list(
-                calendarId='primary',
-                timeMin=now,
-                timeMax=end_date,
-                maxResults=100,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
+            # Follow nextPageToken so results beyond one page are not silently
+            # truncated; 2500 is the Calendar API maximum page size, so most
+            # calendars still complete in a single round trip.
+            events = []
+            page_token = None
+            while True:
+                events_result = calendar_service.events().list(
+                    calendarId='primary',
+                    timeMin=now,
+                    timeMax=end_date,
+                    maxResults=2500,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    pageToken=page_token
+                ).execute()
+                events.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
             
             upcoming_events = []
+            today = datetime.now().date()  # One clock read for the whole batch
             for event in events:
                 start = event['start'].get('dateTime', event['start'].get('date'))
-                
-                # Calculate days until deadline
+
+                # Calculate days until deadline - only whole days matter here,
+                # so parse just the YYYY-MM-DD prefix and skip tz handling
                 try:
-                    event_date = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    days_until = (event_date - datetime.now()).days
-                    
+                    days_until = (date.fromisoformat(start[:10]) - today).days
+
                     # Skip past events (additional safety check)
                     if days_until < 0:
                         continue
-                except:
+                except ValueError:
                     days_until = 0
                 
                 # Determine urgency based on days until
-                if days_until <= 3:
-                    urgency = "high"
-                elif days_until <= 7:
-                    urgency = "medium"
-                else:
-                    urgency = "low"
-                
+                urgency = _URGENCY_LABELS[bisect.bisect_left(_URGENCY_BUCKETS, days_until)]
+
                 # Parse deadline type from title if present
                 title_lower = event.get('summary', '').lower()
-                if 'interview' in title_lower:
-                    deadline_type = 'interview'
-                elif 'assessment' in title_lower or 'coding' in title_lower:
-                    deadline_type = 'assessment'
-                elif 'application' in title_lower:
-                    deadline_type = 'application'
-                else:
-                    deadline_type = 'other'
+                deadline_type = next(
+                    (t for k, t in _TYPE_KEYWORDS if k in title_lower), 'other'
+                )
                 
                 upcoming_events.append({
                     "event_id": event['id'],
@@ -1340,7 +1827,7 @@ def get_upcoming_reminders():
                     "description": event.get('description', '')
                 })
             
-            return jsonify({
+            payload = {
                 "success": True,
                 "user_id": user_id,
                 "query_parameters": {
@@ -1353,7 +1840,15 @@ def get_upcoming_reminders():
                     "medium_urgency": sum(1 for e in upcoming_events if 3 < e.get('days_until', 999) <= 7),
                     "low_urgency": sum(1 for e in upcoming_events if e.get('days_until', 999) > 7)
                 }
-            })
+            }
+
+            if _redis_client:
+                try:
+                    _redis_client.setex(cache_key, 60, json.dumps(payload))
+                except Exception as e:
+                    print(f"⚠️ Upcoming-events cache write failed: {e}")
+
+            return jsonify(payload)
             
         except FileNotFoundError:
             # No calendar credentials - return empty list
@@ -1480,14 +1975,23 @@ def get_dashboard_analytics():
             "traceback": traceback.format_exc()
         }), 500
 
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse a fixed-format ISO-8601 timestamp (with optional 'Z' suffix)"""
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(value)
+    # Avoid the str.replace allocation unless the suffix is actually present
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
 def _is_future_deadline(deadline_date: str) -> bool:
     """Check if deadline is today or in the future"""
     if not deadline_date:
         return False
     try:
-        deadline = datetime.fromisoformat(deadline_date.replace('Z', '+00:00'))
-        return deadline.date() >= datetime.now().date()
-    except Exception as e:
+        # Day granularity is all that matters - parse only the date prefix
+        return date.fromisoformat(deadline_date[:10]) >= date.today()
+    except ValueError as e:
         print(f"⚠️ Error checking deadline date: {e}")
         return False
 
@@ -1509,7 +2013,7 @@ def _get_existing_calendar_events(credentials_override=None):
             credentials.refresh(Request())
         
         # Build Calendar API service
-        service = build('calendar', 'v3', credentials=credentials)
+        service = _get_calendar_service(credentials)
         
         # Query for existing events in the next year
         now = datetime.utcnow().isoformat() + 'Z'
@@ -1542,16 +2046,24 @@ def _get_existing_calendar_events(credentials_override=None):
         print(f"⚠️ Calendar duplicate check failed: {e}")
         return set()
 
-def _calculate_urgency_days(deadline_date):
-    """Calculate days until deadline for urgency calculation"""
-    if not deadline_date:
+def _calculate_urgency_days(deadline_date, now=None):
+    """Calculate days until deadline for urgency calculation
+
+    Pass a precomputed `now` when calling in a loop to avoid re-reading
+    the clock per deadline.
+    """
+    # Cheap guards first - raising/catching is far more expensive than an
+    # if check when malformed dates are common
+    if not deadline_date or len(deadline_date) < 10:
         return None
-    try:
-        deadline = datetime.fromisoformat(deadline_date.replace('Z', '+00:00'))
+    if now is None:
         now = datetime.now()
+    try:
+        deadline = _parse_iso_datetime(deadline_date)
         delta = deadline - now
         return max(0, delta.days)
-    except:
+    except (ValueError, TypeError):
+        # ValueError: malformed date; TypeError: aware/naive mismatch
         return None
 
 if __name__ == '__main__':
@@ -5,31 +5,193 @@ This module handles creating calendar events and reminders.
 Requires Google Calendar API credentials setup.
 """
 
+import logging
 import os
-import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+# Default timezone for created events - matches the 'timeZone' sent to the
+# Calendar API so dateTime/timeZone pairs stay consistent
+DEFAULT_TIMEZONE = 'America/New_York'
+_DEFAULT_TZ = ZoneInfo(DEFAULT_TIMEZONE)
+
+# Level-gated logger instead of unconditional print() - a batch of inserts
+# no longer pays a synchronous stdout write per event
+logger = logging.getLogger(__name__)
+
+# Precompiled deadline parsers - one pass over the strings instead of
+# repeated split/lower calls with exception-driven fallbacks
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)?', re.IGNORECASE)
+
+# Event description template assembled once at import - per-event work is a
+# single format_map instead of rebuilding the full f-string piecewise
+_DESC_TEMPLATE = '\n'.join([
+    '🤖 Automated Deadline Reminder',
+    '',
+    '📧 ORIGINAL EMAIL:',
+    '   Subject: {subject}',
+    '   From: {sender}',
+    '   Date: {email_date}',
+    '',
+    '⏰ DEADLINE DETAILS:',
+    '   Type: {deadline_type}',
+    '   Extracted Text: "{deadline_text}"',
+    '   ',
+    '📋 ACTION REQUIRED:',
+    '   {action}',
+    '',
+    '💡 TIPS:',
+    '   • Set up your materials in advance',
+    '   • Double-check all requirements',
+    '   • Submit early to avoid technical issues',
+    '   ',
+    '🔗 QUICK ACTIONS:',
+    '   • Reply to original email: mailto:{sender}',
+    '   • Mark as completed when done',
+    '   ',
+    '---',
+    'Generated by Email Reminder System on {now}',
+    '',
+])
+
+# Google Calendar batch endpoint caps each multipart request at 50 calls
+BATCH_INSERT_LIMIT = 50
+
+# Shared read-only fallback for .get() chains - avoids allocating a
+# throwaway {} per missing key in hot loops
+_EMPTY = {}
+
+# Reminder sets per deadline type - shared constant tuples, so no per-event
+# list building; to_body() copies before handing them to the API client
+_REMINDERS_DEFAULT = (
+    {'method': 'popup', 'minutes': 60},    # 1 hour before
+    {'method': 'email', 'minutes': 1440},  # 1 day before
+)
+_REMINDERS_APP_ASSESS = _REMINDERS_DEFAULT + (
+    {'method': 'email', 'minutes': 10080},  # 1 week before
+    {'method': 'popup', 'minutes': 4320},   # 3 days before
+)
+_REMINDERS_INTERVIEW = _REMINDERS_DEFAULT + (
+    {'method': 'email', 'minutes': 2880},   # 2 days before
+    {'method': 'popup', 'minutes': 180},    # 3 hours before
+)
+_REMINDERS_BY_TYPE = {
+    'application': _REMINDERS_APP_ASSESS,
+    'assessment': _REMINDERS_APP_ASSESS,
+    'interview': _REMINDERS_INTERVIEW,
+}
+
+# Prototype event body - to_body() shallow-copies this and fills in the
+# dynamic leaves, so the key layout is never rebuilt from scratch
+_EVENT_TEMPLATE = {
+    'summary': None,
+    'description': None,
+    'start': None,
+    'end': None,
+    'reminders': None,
+    'colorId': None,
+    'source': None,
+    'extendedProperties': None,
+}
+
+@dataclass(slots=True, frozen=True)
+class EventSpec:
+    """
+    Compact intermediate form of a calendar event
+
+    Slotted and frozen, so building thousands of specs during a bulk run
+    costs a fraction of the nested-dict representation; the full Calendar
+    API dict is only materialized via to_body() when a request is sent.
+    """
+    summary: str
+    description: str
+    start_iso: str
+    end_iso: str
+    color_id: str
+    reminders: Tuple[Dict, ...]
+    email_id: str
+    deadline_type: str
+    sender: str
+    processed_date: str
+
+    def to_body(self) -> Dict:
+        """Materialize the Google Calendar API event dict"""
+        # Shallow-copy the prototype (a single C-level memcpy of the hash
+        # table), then assign only the dynamic leaves
+        event = _EVENT_TEMPLATE.copy()
+        event['summary'] = self.summary
+        event['description'] = self.description
+        event['start'] = {'dateTime': self.start_iso, 'timeZone': DEFAULT_TIMEZONE}
+        event['end'] = {'dateTime': self.end_iso, 'timeZone': DEFAULT_TIMEZONE}
+        event['reminders'] = {'useDefault': False, 'overrides': list(self.reminders)}
+        event['colorId'] = self.color_id
+        event['source'] = {'title': 'Email Reminder System', 'url': 'mailto:' + self.sender}
+        # Email metadata as extended properties for duplicate detection
+        event['extendedProperties'] = {
+            'private': {
+                'email_id': self.email_id,
+                'deadline_type': self.deadline_type,
+                'created_by': 'email_reminder_system',
+                'original_sender': self.sender,
+                'processed_date': self.processed_date
+            }
+        }
+        return event
 
 try:
-    from google.auth.transport.requests import Request
-    from google_auth_oauthlib.flow import InstalledAppFlow
+    import requests
+    from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
     GOOGLE_LIBRARIES_AVAILABLE = True
 except ImportError:
     GOOGLE_LIBRARIES_AVAILABLE = False
 
+# The OAuth flow stack (google_auth_oauthlib + transport helpers) is only
+# needed when credentials must be obtained or refreshed, so authenticate()
+# imports it lazily - importing this module stays cheap for callers that
+# already hold a valid token.
+
 class CalendarIntegrator:
     """Handles Google Calendar API integration for the email reminder system"""
     
     # Calendar API scopes - read/write access to Calendar
     SCOPES = ['https://www.googleapis.com/auth/calendar']
-    
+
+    # Constant lookup tables - built once at class creation instead of as
+    # dict literals on every event
+    _TITLE_PREFIX = {
+        'application': '📝 APPLICATION DEADLINE',
+        'interview': '🎯 INTERVIEW DEADLINE',
+        'assessment': '💻 ASSESSMENT DEADLINE',
+        'response': '✉️ RESPONSE DEADLINE',
+        'event': '📅 EVENT DEADLINE'
+    }
+
+    _ACTIONS = {
+        'application': 'Submit your complete application with all required documents',
+        'interview': 'Confirm your interview attendance and prepare thoroughly',
+        'assessment': 'Complete the coding challenge or assessment test',
+        'response': 'Send your response or confirmation as requested',
+        'event': 'Register or attend the scheduled event',
+        'other': 'Take the required action as specified in the email'
+    }
+
     def __init__(self, credentials_file='calendar_credentials.json', token_file='calendar_token.json'):
         self.credentials_file = credentials_file
         self.token_file = token_file
         self.service = None
-        
+        self._session = None  # pooled AuthorizedSession, built on authenticate()
+        self._creds = None
+        self._auth_lock = threading.Lock()
+
         if not GOOGLE_LIBRARIES_AVAILABLE:
             raise ImportError(
                 "Google API libraries not installed. Run: "
@@ -40,14 +202,14 @@ class CalendarIntegrator:
         """Authenticate with Google Calendar API using OAuth2"""
         creds = None
         
-        # Load existing token
+        # Load existing token (stored as JSON - no pickle deserialization)
         if os.path.exists(self.token_file):
-            with open(self.token_file, 'rb') as token:
-                creds = pickle.load(token)
+            creds = Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
         
         # If no valid credentials, get new ones
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
+                from google.auth.transport.requests import Request
                 creds.refresh(Request())
             else:
                 if not os.path.exists(self.credentials_file):
@@ -55,20 +217,60 @@ class CalendarIntegrator:
                         f"Calendar credentials file '{self.credentials_file}' not found. "
                         "Download from Google Cloud Console (same project as Gmail)."
                     )
-                
+
+                from google_auth_oauthlib.flow import InstalledAppFlow
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_file, self.SCOPES
                 )
                 creds = flow.run_local_server(port=0)
             
             # Save credentials for next run
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        # Build Calendar service
-        self.service = build('calendar', 'v3', credentials=creds)
+            with open(self.token_file, 'w') as token:
+                token.write(creds.to_json())
+        
+        # Pooled keep-alive session for any raw REST calls - reusing one
+        # CalendarIntegrator keeps connections warm instead of paying a
+        # TCP+TLS handshake per request
+        from google.auth.transport.requests import AuthorizedSession
+        self._session = AuthorizedSession(creds)
+        self._session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=20
+        ))
+
+        # Build Calendar service from the discovery document bundled with
+        # google-api-python-client - skips downloading and parsing the
+        # multi-hundred-KB discovery JSON on every cold start
+        self.service = build(
+            'calendar', 'v3', credentials=creds,
+            cache_discovery=False, static_discovery=True
+        )
+        self._creds = creds
         return self.service
-    
+
+    def _ensure_service(self):
+        """Make sure an authenticated service exists, refreshing in place
+
+        Double-checked under a lock so parallel first calls cannot race
+        into duplicate authenticate() runs, and an expired token is
+        refreshed without re-reading the token file or rebuilding the
+        service from scratch.
+        """
+        # A service with no tracked credentials was injected by a wrapper
+        # (e.g. complete_system's per-user integrators) - trust it as-is
+        if self.service and (self._creds is None or self._creds.valid):
+            return
+
+        with self._auth_lock:
+            # Re-check: another thread may have finished auth while we waited
+            if self.service and (self._creds is None or self._creds.valid):
+                return
+
+            if self.service and self._creds and self._creds.expired and self._creds.refresh_token:
+                from google.auth.transport.requests import Request
+                self._creds.refresh(Request())
+            else:
+                self.authenticate()
+
     def create_deadline_reminder(self, email_data: Dict, deadline_info: Dict) -> Optional[Dict]:
         """
         Create a calendar event for a job deadline
@@ -80,36 +282,131 @@ class CalendarIntegrator:
         Returns:
             Created event dictionary or None if failed
         """
-        if not self.service:
-            self.authenticate()
+        self._ensure_service()
         
         if not deadline_info.get('has_deadline'):
-            print("   ⚠️ No deadline found, skipping calendar event creation")
+            logger.info("⚠️ No deadline found, skipping calendar event creation")
             return None
-        
+
+        results = self.create_deadline_reminders_bulk([(email_data, deadline_info)])
+        event = results.get('0')
+        if isinstance(event, Exception):
+            logger.error("❌ Error creating calendar event: %s", event)
+            return None
+        return event
+
+    def create_deadline_reminders_bulk(self, pairs: List[Tuple[Dict, Dict]]) -> Dict:
+        """
+        Create calendar events for many deadlines using the Calendar batch API
+
+        Each batch bundles up to 50 inserts into a single multipart/mixed POST,
+        so bulk reminder creation pays one HTTP round-trip per 50 events
+        instead of one per event.
+
+        Args:
+            pairs: List of (email_data, deadline_info) tuples
+
+        Returns:
+            Dict mapping the stringified index of each pair to the created
+            event dict, or to the HttpError if that insert failed
+        """
+        self._ensure_service()
+
+        results = {}
+
+        def _collect(request_id, response, exception):
+            results[request_id] = exception if exception else response
+
+        batch = self.service.new_batch_http_request(callback=_collect)
+        pending = 0
+
         try:
-            # Prepare event data
-            event_data = self._prepare_event_data(email_data, deadline_info)
-            
-            # Create the event
-            event = self.service.events().insert(
-                calendarId='primary',
-                body=event_data
-            ).execute()
-            
-            print(f"   ✅ Calendar event created: {event.get('htmlLink', 'No link')}")
-            return event
-            
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for i, (email_data, deadline_info) in enumerate(pairs):
+                spec = self._prepare_event_data(email_data, deadline_info, now_str)
+                batch.add(
+                    self.service.events().insert(calendarId='primary', body=spec.to_body()),
+                    request_id=str(i)
+                )
+                pending += 1
+
+                # Flush at the API's per-batch limit and start a fresh batch
+                if pending == BATCH_INSERT_LIMIT:
+                    batch.execute()
+                    batch = self.service.new_batch_http_request(callback=_collect)
+                    pending = 0
+
+            if pending:
+                batch.execute()
+
+            created = sum(1 for r in results.values() if not isinstance(r, Exception))
+            logger.info("✅ Batch created %d/%d calendar events", created, len(pairs))
+
         except HttpError as e:
-            print(f"   ❌ Error creating calendar event: {e}")
-            return None
+            logger.error("❌ Error executing calendar batch: %s", e)
         except Exception as e:
-            print(f"   ❌ Unexpected error creating calendar event: {e}")
-            return None
-    
-    def _prepare_event_data(self, email_data: Dict, deadline_info: Dict) -> Dict:
-        """Prepare event data for Google Calendar API"""
-        
+            logger.error("❌ Unexpected error executing calendar batch: %s", e)
+
+        return results
+
+    def create_deadline_reminders_parallel(self, pairs: List[Tuple[Dict, Dict]]) -> List[Optional[Dict]]:
+        """
+        Create calendar events concurrently with a bounded thread pool
+
+        Alternative to the batch endpoint for callers that need each created
+        event's result as an ordinary return value. Inserts are I/O-bound,
+        so eight workers overlap the network round-trips (the GIL is
+        released during socket/TLS work). The service's shared httplib2
+        transport is not thread-safe, so each worker executes through its
+        own AuthorizedHttp; the shared client only builds request objects.
+
+        Args:
+            pairs: List of (email_data, deadline_info) tuples
+
+        Returns:
+            List of created event dicts (or None for failures), in input order
+        """
+        # Ensure the service exists up front so workers never race into auth
+        self._ensure_service()
+
+        local = threading.local()
+
+        def _get_http():
+            if getattr(local, 'http', None) is None and self._creds is not None:
+                import httplib2
+                import google_auth_httplib2
+                local.http = google_auth_httplib2.AuthorizedHttp(
+                    self._creds, http=httplib2.Http()
+                )
+            return getattr(local, 'http', None)
+
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        def _insert(pair):
+            email_data, deadline_info = pair
+            if not deadline_info.get('has_deadline'):
+                logger.info("⚠️ No deadline found, skipping calendar event creation")
+                return None
+            try:
+                spec = self._prepare_event_data(email_data, deadline_info, now_str)
+                return self.service.events().insert(
+                    calendarId='primary', body=spec.to_body()
+                ).execute(http=_get_http())
+            except Exception as e:
+                logger.error("❌ Error creating calendar event: %s", e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(_insert, pairs))
+
+    def _prepare_event_data(self, email_data: Dict, deadline_info: Dict,
+                            now_str: Optional[str] = None) -> EventSpec:
+        """Prepare an EventSpec describing the Google Calendar event"""
+
+        # Processing timestamp - batch callers compute this once and pass it in
+        if now_str is None:
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
         # Extract basic info
         subject = email_data.get('subject', 'Job Deadline')
         sender = email_data.get('sender', 'Unknown sender')
@@ -118,64 +415,51 @@ class CalendarIntegrator:
         deadline_time = deadline_info.get('deadline_time', '09:00')
         
         # Create event title
-        title_prefix = {
-            'application': '📝 APPLICATION DEADLINE',
-            'interview': '🎯 INTERVIEW DEADLINE', 
-            'assessment': '💻 ASSESSMENT DEADLINE',
-            'response': '✉️ RESPONSE DEADLINE',
-            'event': '📅 EVENT DEADLINE'
-        }.get(deadline_type, '⏰ DEADLINE')
-        
+        title_prefix = self._TITLE_PREFIX.get(deadline_type, '⏰ DEADLINE')
+
         event_title = f"{title_prefix}: {subject}"
         
         # Create detailed description
-        description = self._create_event_description(email_data, deadline_info)
+        description = self._create_event_description(email_data, deadline_info, now_str)
         
-        # Handle date/time
+        # Handle date/time - precompiled regex fast path with a single
+        # fallback branch for anything unparsable
+        deadline_datetime = None
         if deadline_date:
-            # Parse the deadline date
             try:
                 if 'T' in deadline_date:  # ISO format
                     deadline_datetime = datetime.fromisoformat(deadline_date.replace('Z', '+00:00'))
+                    if deadline_datetime.tzinfo is None:
+                        deadline_datetime = deadline_datetime.replace(tzinfo=_DEFAULT_TZ)
                 else:
-                    # Parse date and add time
-                    date_parts = deadline_date.split('-')
-                    if len(date_parts) == 3:
-                        year, month, day = map(int, date_parts)
-                        
-                        # Parse time
-                        if deadline_time and ':' in deadline_time:
-                            time_parts = deadline_time.split(':')
-                            hour = int(time_parts[0])
-                            minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                            
-                            # Handle AM/PM
-                            if 'pm' in deadline_time.lower() and hour != 12:
-                                hour += 12
-                            elif 'am' in deadline_time.lower() and hour == 12:
-                                hour = 0
-                        else:
-                            hour, minute = 9, 0  # Default to 9 AM
-                        
-                        deadline_datetime = datetime(year, month, day, hour, minute)
-                    else:
-                        # Fallback to tomorrow 9 AM
-                        deadline_datetime = datetime.now() + timedelta(days=1)
-                        deadline_datetime = deadline_datetime.replace(hour=9, minute=0, second=0, microsecond=0)
-                        
-            except Exception as e:
-                print(f"   ⚠️ Error parsing deadline date: {e}")
-                # Fallback to tomorrow
-                deadline_datetime = datetime.now() + timedelta(days=1)
-                deadline_datetime = deadline_datetime.replace(hour=9, minute=0, second=0, microsecond=0)
-        else:
-            # No specific date provided, default to tomorrow
-            deadline_datetime = datetime.now() + timedelta(days=1)
-            deadline_datetime = deadline_datetime.replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # Format for Google Calendar API
-        start_time = deadline_datetime.isoformat() + 'Z'
-        end_time = (deadline_datetime + timedelta(hours=1)).isoformat() + 'Z'  # 1-hour event
+                    date_match = _DATE_RE.match(deadline_date)
+                    if date_match:
+                        hour, minute = 9, 0  # Default to 9 AM
+                        time_match = _TIME_RE.match(deadline_time) if deadline_time else None
+                        if time_match:
+                            hour = int(time_match.group(1))
+                            minute = int(time_match.group(2))
+                            ampm = (time_match.group(3) or '').lower()
+                            # Branchless AM/PM fixup
+                            hour += 12 * (ampm == 'pm' and hour != 12) - 12 * (ampm == 'am' and hour == 12)
+                        deadline_datetime = datetime(
+                            int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3)),
+                            hour, minute, tzinfo=_DEFAULT_TZ
+                        )
+            except ValueError as e:
+                logger.warning("⚠️ Error parsing deadline date: %s", e)
+                deadline_datetime = None
+
+        if deadline_datetime is None:
+            # No parseable deadline - default to tomorrow 9 AM
+            deadline_datetime = (datetime.now(_DEFAULT_TZ) + timedelta(days=1)).replace(
+                hour=9, minute=0, second=0, microsecond=0
+            )
+
+        # Format for Google Calendar API - datetimes are timezone-aware, so
+        # isoformat() already carries the correct UTC offset
+        start_time = deadline_datetime.isoformat(timespec='seconds')
+        end_time = (deadline_datetime + timedelta(hours=1)).isoformat(timespec='seconds')  # 1-hour event
         
         # Set up reminders based on deadline type
         reminders = self._create_reminders(deadline_type)
@@ -187,176 +471,131 @@ class CalendarIntegrator:
         elif deadline_type == 'application':
             color_id = '6'   # Orange for applications
         
-        # Build event object
-        event = {
-            'summary': event_title,
-            'description': description,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'America/New_York',  # Default timezone
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'America/New_York',
-            },
-            'reminders': {
-                'useDefault': False,
-                'overrides': reminders,
-            },
-            'colorId': color_id,
-            'source': {
-                'title': 'Email Reminder System',
-                'url': f"mailto:{sender}"
-            },
-            # Add email metadata as extended properties for duplicate detection
-            'extendedProperties': {
-                'private': {
-                    'email_id': email_data.get('id', ''),
-                    'deadline_type': deadline_type,
-                    'created_by': 'email_reminder_system',
-                    'original_sender': sender,
-                    'processed_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-            }
-        }
-        
-        return event
+        # Build the compact spec - the API dict is materialized by to_body()
+        return EventSpec(
+            summary=event_title,
+            description=description,
+            start_iso=start_time,
+            end_iso=end_time,
+            color_id=color_id,
+            reminders=reminders,
+            email_id=email_data.get('id', ''),
+            deadline_type=deadline_type,
+            sender=sender,
+            processed_date=now_str
+        )
     
-    def _create_event_description(self, email_data: Dict, deadline_info: Dict) -> str:
+    def _create_event_description(self, email_data: Dict, deadline_info: Dict,
+                                  now_str: Optional[str] = None) -> str:
         """Create detailed event description"""
-        
-        subject = email_data.get('subject', 'No subject')
-        sender = email_data.get('sender', 'Unknown sender')
-        email_date = email_data.get('date', 'Unknown date')
-        deadline_text = deadline_info.get('deadline_text', 'Check email for details')
         deadline_type = deadline_info.get('deadline_type', 'deadline')
-        
-        description = f"""🤖 Automated Deadline Reminder
-
-📧 ORIGINAL EMAIL:
-   Subject: {subject}
-   From: {sender}
-   Date: {email_date}
-
-⏰ DEADLINE DETAILS:
-   Type: {deadline_type.title()}
-   Extracted Text: "{deadline_text}"
-   
-📋 ACTION REQUIRED:
-   {self._get_action_text(deadline_type)}
-
-💡 TIPS:
-   • Set up your materials in advance
-   • Double-check all requirements
-   • Submit early to avoid technical issues
-   
-🔗 QUICK ACTIONS:
-   • Reply to original email: mailto:{sender}
-   • Mark as completed when done
-   
----
-Generated by Email Reminder System on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        return description
+        return _DESC_TEMPLATE.format_map({
+            'subject': email_data.get('subject', 'No subject'),
+            'sender': email_data.get('sender', 'Unknown sender'),
+            'email_date': email_data.get('date', 'Unknown date'),
+            'deadline_type': deadline_type.title(),
+            'deadline_text': deadline_info.get('deadline_text', 'Check email for details'),
+            'action': self._get_action_text(deadline_type),
+            'now': now_str or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
     
-    def _get_action_text(self, deadline_type: str) -> str:
-        """Get action text based on deadline type"""
-        actions = {
-            'application': 'Submit your complete application with all required documents',
-            'interview': 'Confirm your interview attendance and prepare thoroughly',
-            'assessment': 'Complete the coding challenge or assessment test',
-            'response': 'Send your response or confirmation as requested',
-            'event': 'Register or attend the scheduled event',
-            'other': 'Take the required action as specified in the email'
-        }
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_action_text(deadline_type: str) -> str:
+        """Get action text based on deadline type (cached - six possible answers)"""
+        actions = CalendarIntegrator._ACTIONS
         return actions.get(deadline_type, actions['other'])
     
-    def _create_reminders(self, deadline_type: str) -> List[Dict]:
-        """Create appropriate reminders based on deadline type"""
-        
-        # Base reminders for all deadlines
-        reminders = [
-            {'method': 'popup', 'minutes': 60},    # 1 hour before
-            {'method': 'email', 'minutes': 1440},  # 1 day before
-        ]
-        
-        # Additional reminders for important deadline types
-        if deadline_type in ['application', 'assessment']:
-            reminders.extend([
-                {'method': 'email', 'minutes': 10080},  # 1 week before
-                {'method': 'popup', 'minutes': 4320},   # 3 days before
-            ])
-        elif deadline_type == 'interview':
-            reminders.extend([
-                {'method': 'email', 'minutes': 2880},   # 2 days before
-                {'method': 'popup', 'minutes': 180},    # 3 hours before
-            ])
-        
-        return reminders
+    def _create_reminders(self, deadline_type: str) -> Tuple[Dict, ...]:
+        """Return the shared reminder tuple for a deadline type"""
+        return _REMINDERS_BY_TYPE.get(deadline_type, _REMINDERS_DEFAULT)
     
     def get_upcoming_reminders(self, days_ahead=30) -> List[Dict]:
         """Get upcoming job deadline events from calendar"""
-        if not self.service:
-            self.authenticate()
+        self._ensure_service()
         
         try:
-            # Calculate time range
-            now = datetime.utcnow()
-            time_min = now.isoformat() + 'Z'
-            time_max = (now + timedelta(days=days_ahead)).isoformat() + 'Z'
+            # Calculate time range - aware UTC datetimes formatted once
+            # (utcnow() is deprecated and produced naive timestamps)
+            now = datetime.now(timezone.utc)
+            time_min = now.isoformat(timespec='seconds').replace('+00:00', 'Z')
+            time_max = (now + timedelta(days=days_ahead)).isoformat(timespec='seconds').replace('+00:00', 'Z')
             
-            # Search for events created by this system
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=50,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            
-            # Filter for reminder system events
+            # Search for events created by this system. The server filters
+            # on our private extended property, the fields mask trims each
+            # event to the keys actually read below, and the pageToken walk
+            # covers windows larger than one page instead of silently
+            # truncating at the old maxResults=50.
+            events = []
+            page_token = None
+            while True:
+                events_result = self.service.events().list(
+                    calendarId='primary',
+                    timeMin=time_min,
+                    timeMax=time_max,
+                    maxResults=2500,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    privateExtendedProperty='created_by=email_reminder_system',
+                    fields='nextPageToken,items(id,summary,htmlLink,start/dateTime,extendedProperties/private)',
+                    pageToken=page_token
+                ).execute()
+                events.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    break
+
+            # Shape results - everything returned was created by this system
             reminder_events = []
+            append = reminder_events.append
             for event in events:
-                # Check if created by our system
-                extended_props = event.get('extendedProperties', {}).get('private', {})
-                if extended_props.get('created_by') == 'email_reminder_system':
-                    reminder_events.append({
-                        'id': event.get('id'),
-                        'title': event.get('summary'),
-                        'start_time': event.get('start', {}).get('dateTime'),
-                        'deadline_type': extended_props.get('deadline_type'),
-                        'original_sender': extended_props.get('original_sender'),
-                        'link': event.get('htmlLink')
-                    })
+                extended_props = (event.get('extendedProperties') or _EMPTY).get('private') or _EMPTY
+                start = event.get('start') or _EMPTY
+                append({
+                    'id': event.get('id'),
+                    'title': event.get('summary'),
+                    'start_time': start.get('dateTime'),
+                    'deadline_type': extended_props.get('deadline_type'),
+                    'original_sender': extended_props.get('original_sender'),
+                    'link': event.get('htmlLink')
+                })
             
             return reminder_events
             
         except Exception as e:
-            print(f"❌ Error fetching calendar events: {e}")
+            logger.error("❌ Error fetching calendar events: %s", e)
             return []
     
     def delete_reminder(self, event_id: str) -> bool:
         """Delete a reminder event"""
-        if not self.service:
-            self.authenticate()
+        self._ensure_service()
         
         try:
             self.service.events().delete(
                 calendarId='primary',
                 eventId=event_id
             ).execute()
-            print(f"✅ Deleted reminder event: {event_id}")
+            logger.info("✅ Deleted reminder event: %s", event_id)
             return True
             
         except Exception as e:
-            print(f"❌ Error deleting reminder: {e}")
+            logger.error("❌ Error deleting reminder: %s", e)
             return False
 
-# Demo function for testing Calendar integration  
+# Shared default integrator - the token load, discovery build and warm
+# connection pool are paid once per process instead of once per caller
+_default_integrator: Optional[CalendarIntegrator] = None
+
+def get_default_integrator() -> CalendarIntegrator:
+    """Return a lazily-built, authenticated CalendarIntegrator shared by all callers"""
+    global _default_integrator
+    if _default_integrator is None:
+        integrator = CalendarIntegrator()
+        integrator.authenticate()
+        _default_integrator = integrator
+    return _default_integrator
+
+# Demo function for testing Calendar integration
 def test_calendar_integration():
     """Test function to verify Calendar API setup"""
     print("🧪 Testing Google Calendar Integration...")
@@ -367,11 +606,9 @@ def test_calendar_integration():
         return
     
     try:
-        calendar = CalendarIntegrator()
-        
-        # Test authentication
+        # Test authentication via the shared integrator
         print("🔑 Authenticating with Google Calendar...")
-        calendar.authenticate()
+        calendar = get_default_integrator()
         print("✅ Authentication successful")
         
         # Test creating a sample reminder
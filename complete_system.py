@@ -10,6 +10,11 @@ This is the main integrated system that combines:
 
 import os
 import json
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
@@ -39,94 +44,315 @@ try:
 except ImportError:
     AUTOGEN_AVAILABLE = False
 
+# Raw OpenAI client - lets the single-turn classifier use structured
+# outputs (guaranteed-parseable JSON) instead of a free-form agent reply
+try:
+    from openai import OpenAI
+    OPENAI_CLIENT_AVAILABLE = True
+except ImportError:
+    OPENAI_CLIENT_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
+# Gmail's batch endpoint caps each multipart request at 100 calls
+GMAIL_BATCH_LIMIT = 100
+
+# Shared decoder for extracting JSON from free-form LLM replies
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str, opener: str = '{'):
+    """Parse the first JSON value starting at `opener` in a free-form reply
+
+    raw_decode scans forward exactly once from the first brace/bracket and
+    stops at the value's natural end, unlike a greedy DOTALL regex whose
+    backtracking goes quadratic on long replies - and it validates the
+    JSON in the same pass. Raises ValueError when no parseable value is
+    present.
+    """
+    start = text.index(opener)
+    value, _ = _JSON_DECODER.raw_decode(text, start)
+    return value
+
+# Emails classified per combined LLM prompt - amortizes the system prompt
+# and the HTTP round trip across the group
+LLM_BATCH_SIZE = 10
+
+# Cap on body characters sent to the LLM - input (prefill) tokens dominate
+# classification latency and cost while the output stays tiny
+LLM_BODY_LIMIT = 2000
+
+_WS_RUN_RE = re.compile(r'[ \t]{2,}')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
+def _strip_quoted_replies(body: str) -> str:
+    """Trim quoted reply lines, signatures and repeated whitespace
+
+    Marketing and reply chains carry kilobytes of quoted text the
+    classifier doesn't need; dropping it before prompting keeps the LLM
+    input short without losing the email's own content.
+    """
+    if not body:
+        return ''
+
+    # Cut everything after a standard signature delimiter
+    for delimiter in ('\n-- \n', '\n--\n'):
+        cut = body.find(delimiter)
+        if cut != -1:
+            body = body[:cut]
+            break
+
+    # Drop quoted reply lines, then collapse whitespace runs
+    body = '\n'.join(
+        line for line in body.splitlines() if not line.lstrip().startswith('>')
+    )
+    body = _WS_RUN_RE.sub(' ', body)
+    return _BLANK_RUN_RE.sub('\n\n', body)
+
+# Response schema for the single-email classifier. strict json_schema mode
+# makes the model emit exactly this object - no prose scaffolding to pay
+# output tokens for and no regex extraction that can fail
+_CLASSIFICATION_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "email_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "is_job_related": {"type": "boolean"},
+                "confidence": {"type": "number"},
+                "category": {
+                    "type": "string",
+                    "enum": [
+                        "job_posting", "interview", "assessment", "deadline",
+                        "application", "academic", "networking", "other"
+                    ]
+                },
+                "urgency": {"type": "string", "enum": ["high", "medium", "low"]},
+                "reasoning": {"type": "string"}
+            },
+            "required": [
+                "is_job_related", "confidence", "category", "urgency", "reasoning"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+def _iter_chunks(iterable, size):
+    """Yield lists of at most size items, without materializing the source"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+# Partial-response mask for full fetches - everything else in the message
+# resource (labels, sizes, thread/history ids) is never read by the parser
+GMAIL_FULL_FIELDS = 'id,snippet,payload'
+
 class UserSpecificGmailIntegrator:
     """Wrapper for Gmail service with user-specific credentials"""
     
     def __init__(self, gmail_service):
         self.service = gmail_service
-    
-    def get_recent_emails(self, max_results=50, days_back=7, query=""):
-        """Fetch recent emails using authenticated service"""
-        from datetime import datetime, timedelta
-        import base64
-        
-        # Build query for recent emails
-        date_filter = datetime.now() - timedelta(days=days_back)
-        date_str = date_filter.strftime('%Y/%m/%d')
-        
-        search_query = f"after:{date_str}"
-        if query:
-            search_query += f" {query}"
-        
+        self._parser = None  # shared GmailIntegrator used only for parsing
+
+    def get_recent_emails(self, max_results=50, days_back=7, query="", prefilter=None):
+        """Fetch recent emails using authenticated service
+
+        Materializes the stream from iter_recent_emails for callers that
+        need a list (len(), reuse); scans that process emails one at a
+        time should iterate iter_recent_emails directly instead.
+        """
         try:
-            # Get list of messages
-            results = self.service.users().messages().list(
-                userId='me', 
-                q=search_query,
-                maxResults=max_results
-            ).execute()
-            
-            messages = results.get('messages', [])
-            emails = []
-            
-            for message in messages:
-                try:
-                    # Get full message details
-                    msg = self.service.users().messages().get(
-                        userId='me', 
-                        id=message['id'],
-                        format='full'
-                    ).execute()
-                    
-                    email_data = self._parse_email_message(msg)
-                    if email_data:
-                        emails.append(email_data)
-                        
-                except Exception as e:
-                    print(f"   ⚠️ Error processing email: {e}")
-                    continue
-            
-            return emails
-            
+            return list(self.iter_recent_emails(
+                max_results=max_results,
+                days_back=days_back,
+                query=query,
+                prefilter=prefilter
+            ))
         except Exception as e:
             print(f"❌ Error fetching emails: {e}")
             return []
+
+    def iter_recent_emails(self, max_results=50, days_back=7, query="", prefilter=None):
+        """Stream recent emails page by page, yielding one parsed dict at a time
+
+        Pagination runs through list_next, so only one listing page of ids
+        and one fetch batch of full messages are resident at once - peak
+        memory is O(page) rather than O(total emails). When prefilter is
+        given, each page runs in two passes: pass 1 batch-fetches headers
+        only (format='metadata') and the prefilter drops obviously
+        irrelevant messages from their header stubs; pass 2 downloads the
+        full payload just for the survivors - most bytes in a typical
+        inbox never cross the wire.
+        """
+        from datetime import datetime, timedelta
+
+        # Build query for recent emails. after:<epoch> keeps second-level
+        # resolution (the %Y/%m/%d form rounds down to the day, returning up
+        # to an extra day of messages), and the category filters keep
+        # promotional/social traffic from being fetched and parsed at all.
+        date_filter = datetime.now() - timedelta(days=days_back)
+        epoch = int(date_filter.timestamp())
+
+        search_query = f"after:{epoch} category:primary"
+        if query:
+            search_query += f" {query}"
+
+        fetched = 0
+        request = self.service.users().messages().list(
+            userId='me',
+            q=search_query,
+            maxResults=max_results
+        )
+        while request is not None and fetched < max_results:
+            response = request.execute()
+            message_ids = [m['id'] for m in response.get('messages', [])]
+            message_ids = message_ids[:max_results - fetched]
+            fetched += len(message_ids)
+
+            # Pass 1 (optional): headers-only stubs, keep ids the prefilter likes
+            if prefilter is not None and message_ids:
+                header_stubs = self._fetch_header_stubs(message_ids)
+                message_ids = [
+                    mid for mid in message_ids
+                    if mid in header_stubs and prefilter(header_stubs[mid])
+                ]
+
+            # Pass 2: full payloads for whatever survived this page
+            yield from self._fetch_full_messages(message_ids)
+
+            request = self.service.users().messages().list_next(request, response)
     
+    def _fetch_full_messages(self, message_ids):
+        """Batch-fetch and parse full messages for a list of ids
+
+        Up to 100 gets travel in one multipart request instead of one
+        round-trip per message, and the fields mask strips resource keys
+        the parser never reads.
+        """
+        emails = []
+
+        def _collect(request_id, response, exception):
+            if exception:
+                print(f"   ⚠️ Error processing email: {exception}")
+                return
+            email_data = self._parse_email_message(response)
+            if email_data:
+                emails.append(email_data)
+
+        for start in range(0, len(message_ids), GMAIL_BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for mid in message_ids[start:start + GMAIL_BATCH_LIMIT]:
+                batch.add(self.service.users().messages().get(
+                    userId='me',
+                    id=mid,
+                    format='full',
+                    fields=GMAIL_FULL_FIELDS
+                ))
+            batch.execute()
+
+        return emails
+
+    def get_emails_since_history(self, start_history_id, max_results=50):
+        """Fetch only messages added since a saved history id
+
+        users().history().list returns deltas, so a steady-state rescan
+        costs O(new messages) instead of re-listing the whole date window.
+        Raises if the history id has expired (Gmail returns 404) so the
+        caller can fall back to date-based listing.
+        """
+        message_ids = []
+        page_token = None
+        while True:
+            response = self.service.users().history().list(
+                userId='me',
+                startHistoryId=start_history_id,
+                historyTypes=['messageAdded'],
+                pageToken=page_token
+            ).execute()
+            for record in response.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    message_ids.append(added['message']['id'])
+            page_token = response.get('nextPageToken')
+            if not page_token or len(message_ids) >= max_results:
+                break
+
+        return self._fetch_full_messages(message_ids[:max_results])
+
+    def get_history_id(self):
+        """Return the mailbox's current history id (for the next incremental scan)"""
+        profile = self.service.users().getProfile(
+            userId='me', fields='historyId'
+        ).execute()
+        return profile.get('historyId')
+
+    def _fetch_header_stubs(self, message_ids):
+        """Batch-fetch headers-only stubs (no body bytes) for a list of ids"""
+        stubs = {}
+
+        def _collect(request_id, response, exception):
+            if exception:
+                return
+            # Headers-only parse: pure dict walk, no base64 body decode
+            stub = self._get_parser()._parse_headers_only(response)
+            if stub:
+                stubs[stub['id']] = stub
+
+        for start in range(0, len(message_ids), GMAIL_BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for mid in message_ids[start:start + GMAIL_BATCH_LIMIT]:
+                batch.add(self.service.users().messages().get(
+                    userId='me',
+                    id=mid,
+                    format='metadata',
+                    metadataHeaders=['Subject', 'From', 'Date', 'To']
+                ))
+            batch.execute()
+
+        return stubs
+
+    def _get_parser(self):
+        """Cached GmailIntegrator used only for its stateless parsing helpers
+
+        Building a fresh integrator per message paid its credential-handling
+        constructor on every parse; __new__ skips __init__ since only the
+        parsing methods are needed.
+        """
+        if self._parser is None:
+            from gmail_integration import GmailIntegrator
+            self._parser = GmailIntegrator.__new__(GmailIntegrator)
+        return self._parser
+
     def _parse_email_message(self, message):
         """Parse Gmail API message into structured dictionary"""
-        # Reuse the parsing logic from GmailIntegrator
-        from gmail_integration import GmailIntegrator
-        integrator = GmailIntegrator()
-        return integrator._parse_email_message(message)
+        return self._get_parser()._parse_full(message)
 
 class UserSpecificCalendarIntegrator:
     """Wrapper for Calendar service with user-specific credentials"""
     
     def __init__(self, calendar_service):
         self.service = calendar_service
-    
+        self._integrator = None  # cached CalendarIntegrator bound to our service
+
+    def _get_integrator(self):
+        """Lazily build one CalendarIntegrator wired to the user's service"""
+        if self._integrator is None:
+            from calendar_integration import CalendarIntegrator
+            integrator = CalendarIntegrator()
+            integrator.service = self.service
+            self._integrator = integrator
+        return self._integrator
+
     def create_deadline_reminder(self, email_data: Dict, deadline_info: Dict):
         """Create calendar event using authenticated service"""
-        from calendar_integration import CalendarIntegrator
-        
-        # Create a temporary integrator to use the existing logic
-        temp_integrator = CalendarIntegrator()
-        temp_integrator.service = self.service
-        
-        return temp_integrator.create_deadline_reminder(email_data, deadline_info)
-    
+        return self._get_integrator().create_deadline_reminder(email_data, deadline_info)
+
     def get_upcoming_reminders(self, days_ahead=30):
         """Get upcoming reminders using authenticated service"""
-        from calendar_integration import CalendarIntegrator
-        
-        # Create a temporary integrator to use the existing logic
-        temp_integrator = CalendarIntegrator()
-        temp_integrator.service = self.service
-        
-        return temp_integrator.get_upcoming_reminders(days_ahead)
+        return self._get_integrator().get_upcoming_reminders(days_ahead)
 
 class IntegratedEmailReminderSystem:
     """
@@ -184,10 +410,80 @@ class IntegratedEmailReminderSystem:
                 except Exception as e:
                     print(f"⚠️ Calendar setup failed: {e}")
         
+        # Persistent analysis cache - Gmail message ids are immutable, so a
+        # re-scan of an already-analyzed message can skip the LLM round trip
+        # (the dominant per-email cost) entirely. Plain dict as in-process L1.
+        self._analysis_cache = {}
+        self._cache_conn = None
+        # Serializes calendar inserts - the shared service transport is not
+        # guaranteed thread-safe under the parallel scan loop
+        self._calendar_lock = threading.Lock()
+        try:
+            os.makedirs('.cache', exist_ok=True)
+            self._cache_conn = sqlite3.connect(
+                os.path.join('.cache', 'email_analysis.sqlite'),
+                check_same_thread=False
+            )
+            self._cache_conn.execute(
+                'CREATE TABLE IF NOT EXISTS email_analysis ('
+                'user_id TEXT, email_id TEXT, result TEXT, '
+                'PRIMARY KEY (user_id, email_id))'
+            )
+            self._cache_conn.execute(
+                'CREATE TABLE IF NOT EXISTS scan_state ('
+                'user_id TEXT PRIMARY KEY, last_history_id TEXT)'
+            )
+            self._cache_conn.commit()
+        except Exception as e:
+            print(f"⚠️ Analysis cache unavailable: {e}")
+            self._cache_conn = None
+
         # LLM-based agents (if available)
+        self._openai_client = None
+        self._openai_model = None
         if self.use_llm:
             self.setup_llm_agents()
-    
+
+    def _cached_analysis(self, email_id):
+        """Look up a prior analysis for this message id (L1 dict, then sqlite)"""
+        if not email_id:
+            return None
+        result = self._analysis_cache.get(email_id)
+        if result is not None:
+            return result
+        if self._cache_conn:
+            try:
+                row = self._cache_conn.execute(
+                    'SELECT result FROM email_analysis WHERE user_id = ? AND email_id = ?',
+                    (self.user_id or '', email_id)
+                ).fetchone()
+            except Exception:
+                return None
+            if row:
+                result = json.loads(row[0])
+                self._analysis_cache[email_id] = result
+                return result
+        return None
+
+    def _store_analysis(self, email_id, result):
+        """Persist an analysis result, dropping the large body text"""
+        if not email_id:
+            return
+        self._analysis_cache[email_id] = result
+        if self._cache_conn:
+            try:
+                slim = dict(result)
+                email_data = dict(slim.get('email_data') or {})
+                email_data.pop('body', None)
+                slim['email_data'] = email_data
+                self._cache_conn.execute(
+                    'INSERT OR REPLACE INTO email_analysis VALUES (?, ?, ?)',
+                    (self.user_id or '', email_id, json.dumps(slim, default=str))
+                )
+                self._cache_conn.commit()
+            except Exception as e:
+                print(f"⚠️ Analysis cache write failed: {e}")
+
     def setup_llm_agents(self):
         """Setup AutoGen LLM agents for enhanced analysis"""
         try:
@@ -224,7 +520,13 @@ class IntegratedEmailReminderSystem:
                     "temperature": 0.0,
                 }
                 print("✅ Using OpenAI GPT for LLM analysis")
-            
+                if OPENAI_CLIENT_AVAILABLE:
+                    # Direct client for the single-turn classifier: JSON-mode
+                    # structured outputs skip AutoGen's agent machinery and
+                    # the free-form-reply parsing it forces
+                    self._openai_client = OpenAI(api_key=api_key)
+                    self._openai_model = "gpt-4o-mini"
+
             self.user_proxy = autogen.UserProxyAgent(
                 name="UserProxy",
                 human_input_mode="NEVER",
@@ -252,51 +554,129 @@ class IntegratedEmailReminderSystem:
             print(f"⚠️ LLM agent setup failed: {e}")
             self.use_llm = False
     
+    def _load_history_id(self):
+        """Return the history id saved after the previous scan, if any"""
+        if not self._cache_conn:
+            return None
+        try:
+            row = self._cache_conn.execute(
+                'SELECT last_history_id FROM scan_state WHERE user_id = ?',
+                (self.user_id or '',)
+            ).fetchone()
+            return row[0] if row else None
+        except Exception:
+            return None
+
+    def _store_history_id(self, history_id):
+        """Persist the mailbox history id for the next incremental scan"""
+        if not self._cache_conn or not history_id:
+            return
+        try:
+            self._cache_conn.execute(
+                'INSERT OR REPLACE INTO scan_state VALUES (?, ?)',
+                (self.user_id or '', str(history_id))
+            )
+            self._cache_conn.commit()
+        except Exception as e:
+            print(f"⚠️ History id save failed: {e}")
+
     def analyze_email_enhanced(self, email_data: Dict) -> Dict:
         """Enhanced email analysis using LLM + rule-based fallback"""
-        
+
+        # Serve repeat messages from the cache - no LLM call, no re-analysis
+        email_id = email_data.get('id')
+        cached = self._cached_analysis(email_id)
+        if cached is not None:
+            return cached
+
+        # Cheap subject/sender screen: obviously unrelated mail never reaches
+        # the LLM (or the full rule-based body scan)
+        if not self.rule_based_system.cheap_prefilter(email_data):
+            result = {
+                "email_data": email_data,
+                "classification": {
+                    "is_job_related": False,
+                    "confidence": 0.9,
+                    "reason": "No job signals in subject or sender",
+                    "category": "other",
+                    "urgency": "low"
+                },
+                "deadline_info": None,
+                "calendar_event": None,
+                "analysis_method": "prefilter"
+            }
+            self._store_analysis(email_id, result)
+            return result
+
+        result = None
+        llm_failed = False
         if self.use_llm:
             try:
                 # Try LLM analysis first
-                return self._analyze_with_llm(email_data)
+                result = self._analyze_with_llm(email_data)
             except Exception as e:
                 print(f"   ⚠️ LLM analysis failed: {e}, falling back to rule-based")
-        
-        # Fallback to rule-based analysis (with calendar service for duplicate detection)
-        calendar_service = getattr(self.calendar, 'service', None) if self.calendar else None
-        return self.rule_based_system.analyze_email(email_data, calendar_service=calendar_service)
+                llm_failed = True
+
+        if result is None:
+            # Fallback to rule-based analysis (with calendar service for duplicate detection)
+            calendar_service = getattr(self.calendar, 'service', None) if self.calendar else None
+            result = self.rule_based_system.analyze_email(email_data, calendar_service=calendar_service)
+
+        # A rule-based answer forced by a transient LLM failure (rate limit,
+        # network) is degraded - caching it under the immutable message id
+        # would pin it forever and the message would never see the LLM.
+        # Leave it uncached so the next scan retries.
+        if not llm_failed:
+            self._store_analysis(email_id, result)
+        return result
     
     def _analyze_with_llm(self, email_data: Dict) -> Dict:
         """Analyze email using AutoGen LLM agents"""
+        body = _strip_quoted_replies(email_data.get('body', ''))[:LLM_BODY_LIMIT]
         email_text = f"""
         Subject: {email_data.get('subject', '')}
         From: {email_data.get('sender', '')}
         Date: {email_data.get('date', '')}
-        
+
         Body:
-        {email_data.get('body', '')}
+        {body}
         """
         
-        # Enhanced classification
+        # Enhanced classification. With the direct OpenAI client available,
+        # a structured-output call guarantees a parseable object and skips
+        # both the agent round trip and the regex extraction below
+        if self._openai_client is not None:
+            completion = self._openai_client.chat.completions.create(
+                model=self._openai_model,
+                temperature=0.0,
+                response_format=_CLASSIFICATION_SCHEMA,
+                messages=[
+                    {"role": "system", "content": self.enhanced_classifier.system_message},
+                    {"role": "user", "content": f"Analyze this email for job relevance:\n\n{email_text}"},
+                ]
+            )
+            llm_classification = json.loads(completion.choices[0].message.content)
+            return self._finish_analysis(email_data, llm_classification)
+
         response = self.user_proxy.initiate_chat(
             self.enhanced_classifier,
             message=f"Analyze this email for job relevance:\n\n{email_text}",
             silent=True
         )
-        
+
         # Parse LLM response
         try:
             response_text = response.chat_history[-1]['content']
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                llm_classification = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in LLM response")
-        except:
+            llm_classification = _extract_json(response_text)
+        except (KeyError, ValueError, IndexError):
             # Fallback to rule-based if LLM parsing fails
             return self.rule_based_system.analyze_email(email_data)
-        
+
+        return self._finish_analysis(email_data, llm_classification)
+
+    def _finish_analysis(self, email_data: Dict, llm_classification: Dict) -> Dict:
+        """Attach deadline extraction and calendar creation to a classification"""
         # If job-related, extract deadlines using rule-based system (more reliable)
         result = {
             "email_data": email_data,
@@ -305,27 +685,143 @@ class IntegratedEmailReminderSystem:
             "calendar_event": None,
             "analysis_method": "llm_enhanced"
         }
-        
+
         if llm_classification.get("is_job_related", False):
             # Use rule-based deadline extraction (more reliable than LLM for dates)
             deadline_info = self.rule_based_system.extract_deadlines_rule_based(email_data)
             result["deadline_info"] = deadline_info
-            
+
             # Create calendar event if deadline found (with duplicate detection)
             if deadline_info.get("has_deadline", False):
                 calendar_service = getattr(self.calendar, 'service', None) if self.calendar else None
                 try:
-                    calendar_event = self.rule_based_system.create_calendar_event(
-                        email_data, 
-                        deadline_info,
-                        calendar_service=calendar_service
-                    )
+                    with self._calendar_lock:
+                        calendar_event = self.rule_based_system.create_calendar_event(
+                            email_data,
+                            deadline_info,
+                            calendar_service=calendar_service
+                        )
                     result["calendar_event"] = calendar_event
                 except Exception as e:
                     print(f"   ⚠️ Calendar event creation failed: {e}")
-        
+
         return result
+
+    def _analyze_batch_with_llm(self, emails: List[Dict]) -> List[Dict]:
+        """Classify several emails with a single LLM call
+
+        One prompt carries compact summaries of the whole group and asks
+        for a JSON array of classifications, so the fixed system-prompt
+        tokens and the HTTP round trip are paid once per batch instead of
+        once per email. Returns one result dict per email, in input order;
+        emails the model skips fall back to rule-based analysis.
+        """
+        items = [
+            {
+                "id": i,
+                "subject": e.get('subject', ''),
+                "from": e.get('sender', ''),
+                "body": _strip_quoted_replies(e.get('body') or '')[:LLM_BODY_LIMIT],
+            }
+            for i, e in enumerate(emails)
+        ]
+
+        prompt = (
+            "Classify each of the following emails for job relevance. "
+            "Respond ONLY with a JSON array containing one object per email, "
+            'each shaped like {"id": <id>, "is_job_related": true/false, '
+            '"confidence": 0.0-1.0, "category": "job_posting|interview|assessment|'
+            'deadline|application|academic|networking|other", '
+            '"urgency": "high|medium|low", "reasoning": "brief explanation"}.\n\n'
+            + json.dumps(items)
+        )
+
+        response = self.user_proxy.initiate_chat(
+            self.enhanced_classifier,
+            message=prompt,
+            silent=True
+        )
+
+        response_text = response.chat_history[-1]['content']
+        classifications = {c.get('id'): c for c in _extract_json(response_text, '[')}
+
+        results = []
+        for i, email_data in enumerate(emails):
+            classification = classifications.get(i)
+            if classification is None:
+                results.append(self.rule_based_system.analyze_email(email_data))
+            else:
+                results.append(self._finish_analysis(email_data, classification))
+        return results
     
+    def _analyze_emails(self, emails):
+        """Yield (email, result_or_exception) pairs for a scan
+
+        Accepts any iterable (including the lazy iter_recent_emails
+        stream) and pulls it one window at a time, so peak memory stays
+        O(window). With the LLM enabled, uncached emails in each window
+        are sorted by approximate length and classified in shared
+        prompts of LLM_BATCH_SIZE at a time - similar-sized emails share
+        a prompt, so short ones never pad out a batch dominated by one
+        long message - then yielded back in arrival order (cached ones
+        are served immediately); without it, each email runs on the
+        thread pool.
+        """
+        if self.use_llm:
+            for window in _iter_chunks(emails, LLM_BATCH_SIZE * 4):
+                pending = []
+                cached_results = {}
+                for email in window:
+                    cached = self._cached_analysis(email.get('id'))
+                    if cached is not None:
+                        cached_results[id(email)] = cached
+                    else:
+                        pending.append(email)
+
+                # Bin similar lengths together before batching
+                pending.sort(
+                    key=lambda e: len(e.get('subject', '')) + len(e.get('body') or '')
+                )
+
+                batch_outcomes = {}
+                for group in _iter_chunks(pending, LLM_BATCH_SIZE):
+                    try:
+                        batch_results = self._analyze_batch_with_llm(group)
+                    except Exception as e:
+                        print(f"   ⚠️ Batch LLM analysis failed: {e}, analyzing individually")
+                        for email in group:
+                            try:
+                                batch_outcomes[id(email)] = self.analyze_email_enhanced(email)
+                            except Exception as err:
+                                batch_outcomes[id(email)] = err
+                        continue
+
+                    for email, result in zip(group, batch_results):
+                        self._store_analysis(email.get('id'), result)
+                        batch_outcomes[id(email)] = result
+
+                # Un-permute: yield the window in its original arrival order
+                for email in window:
+                    if id(email) in cached_results:
+                        yield email, cached_results[id(email)]
+                    else:
+                        yield email, batch_outcomes[id(email)]
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # Submit one chunk at a time so a streaming source never has
+                # its whole backlog pinned behind pending futures
+                for group in _iter_chunks(emails, 32):
+                    futures = {
+                        executor.submit(self.analyze_email_enhanced, email): email
+                        for email in group
+                    }
+                    for future in as_completed(futures):
+                        email = futures[future]
+                        try:
+                            yield email, future.result()
+                        except Exception as e:
+                            yield email, e
+
     def scan_gmail_and_process(self, max_emails=50, days_back=7, query="") -> List[Dict]:
         """
         Main workflow: Scan Gmail and process all emails
@@ -352,67 +848,168 @@ class IntegratedEmailReminderSystem:
             print("❌ Gmail not available")
             raise Exception("Gmail integration is not initialized. Please authenticate with Google.")
         
-        # Fetch emails from Gmail
+        # Fetch emails from Gmail - incrementally via the history API when a
+        # prior scan left a history id, otherwise the full date-window listing
         print(f"📧 Fetching emails from Gmail (last {days_back} days)...")
         try:
-            emails = self.gmail.get_recent_emails(
-                max_results=max_emails,
-                days_back=days_back,
-                query=query
-            )
-            
-            if not emails:
+            emails = None
+            last_history_id = self._load_history_id() if not query else None
+            if last_history_id and hasattr(self.gmail, 'get_emails_since_history'):
+                try:
+                    emails = self.gmail.get_emails_since_history(
+                        last_history_id, max_results=max_emails
+                    )
+                    print(f"   ⚡ Incremental scan: {len(emails)} new messages since last run")
+                except Exception as e:
+                    # History expired (404) or unavailable - full listing instead
+                    print(f"   ⚠️ History scan unavailable ({e}), using full listing")
+                    emails = None
+
+            if emails is None:
+                if hasattr(self.gmail, 'iter_recent_emails'):
+                    # Lazy stream: each email is parsed, analyzed and
+                    # discarded inside the loop below, so peak memory is
+                    # one fetch page instead of the whole scan window.
+                    # The header prefilter keeps full bodies of obviously
+                    # unrelated mail from ever being downloaded.
+                    emails = self.gmail.iter_recent_emails(
+                        max_results=max_emails,
+                        days_back=days_back,
+                        query=query,
+                        prefilter=self.rule_based_system.cheap_prefilter
+                    )
+                else:
+                    emails = self.gmail.get_recent_emails(
+                        max_results=max_emails,
+                        days_back=days_back,
+                        query=query
+                    )
+
+            # Capture where this scan's window ends, but persist it only
+            # after the processing loop finishes - recording it now would
+            # let a mid-scan crash skip these messages forever on the next
+            # incremental run. Mail arriving during analysis is re-covered,
+            # which the analysis cache absorbs.
+            new_history_id = None
+            if hasattr(self.gmail, 'get_history_id'):
+                try:
+                    new_history_id = self.gmail.get_history_id()
+                except Exception as e:
+                    print(f"   ⚠️ Could not read history id: {e}")
+
+            if isinstance(emails, list) and not emails:
                 print("📭 No emails found")
+                # Nothing to process, so advancing the cursor is safe here
+                if new_history_id is not None:
+                    try:
+                        self._store_history_id(new_history_id)
+                    except Exception as e:
+                        print(f"   ⚠️ Could not record history id: {e}")
                 return []
-                
+
         except Exception as e:
             print(f"❌ Gmail fetch failed: {e}")
             raise Exception(f"Failed to fetch emails from Gmail: {str(e)}")
-        
-        # Process each email
-        print(f"\n🔍 Analyzing {len(emails)} emails...")
+
+        # Process emails - batched LLM prompts when the LLM is enabled,
+        # thread-pooled rule-based analysis otherwise
+        total = len(emails) if isinstance(emails, list) else max_emails
+        print(f"\n🔍 Analyzing up to {total} emails...")
         results = []
-        
+
+        done = 0
         job_related_count = 0
         deadlines_found = 0
         calendar_events_created = 0
+
+        for done, (email, result) in enumerate(self._analyze_emails(emails), 1):
+            print(f"\n📧 [{done}/{total}] {email.get('subject', 'No Subject')[:50]}...")
+
+            if isinstance(result, Exception):
+                print(f"   ❌ Analysis failed: {result}")
+                continue
+
+            results.append(result)
+
+            # Update counters
+            if result['classification'].get('is_job_related', False):
+                job_related_count += 1
+                print(f"   🎯 Job-related: {result['classification'].get('category', 'unknown')}")
+
+                if result.get('deadline_info', {}).get('has_deadline', False):
+                    deadlines_found += 1
+                    deadline_date = result['deadline_info'].get('deadline_date', 'unknown')
+                    print(f"   ⏰ Deadline: {deadline_date}")
+
+                    if result.get('calendar_event'):
+                        calendar_events_created += 1
+                        print(f"   📅 Calendar reminder created")
         
-        for i, email in enumerate(emails):
-            print(f"\n📧 [{i+1}/{len(emails)}] {email.get('subject', 'No Subject')[:50]}...")
-            
+        # Every message has been analyzed - now it is safe to advance the
+        # incremental-scan cursor
+        if new_history_id is not None:
             try:
-                # Analyze email
-                result = self.analyze_email_enhanced(email)
-                results.append(result)
-                
-                # Update counters
-                if result['classification'].get('is_job_related', False):
-                    job_related_count += 1
-                    print(f"   🎯 Job-related: {result['classification'].get('category', 'unknown')}")
-                    
-                    if result.get('deadline_info', {}).get('has_deadline', False):
-                        deadlines_found += 1
-                        deadline_date = result['deadline_info'].get('deadline_date', 'unknown')
-                        print(f"   ⏰ Deadline: {deadline_date}")
-                        
-                        if result.get('calendar_event'):
-                            calendar_events_created += 1
-                            print(f"   📅 Calendar reminder created")
-                
+                self._store_history_id(new_history_id)
             except Exception as e:
-                print(f"   ❌ Analysis failed: {e}")
-                continue
-        
+                print(f"   ⚠️ Could not record history id: {e}")
+
         # Final summary
         print(f"\n🎉 Email Processing Complete!")
         print(f"📊 Results Summary:")
-        print(f"   📧 Total emails: {len(emails)}")
+        print(f"   📧 Total emails: {done}")
         print(f"   💼 Job-related: {job_related_count}")
         print(f"   ⏰ Deadlines found: {deadlines_found}")
         print(f"   📅 Calendar events: {calendar_events_created}")
         
         return results
     
+    def iter_process_user_emails(self, user_id, max_emails=50, days_back=7, search_query=""):
+        """Lazily yield enhanced analyses of a user's recent emails
+
+        Generator counterpart of process_user_emails for streaming
+        callers: emails come off the lazy Gmail listing one page at a
+        time and flow through _analyze_emails, so the first result is
+        ready after one fetch-and-analyze window instead of after the
+        whole scan, and the result set is never held as one list.
+        Emails whose analysis raises are logged and skipped, matching
+        the list variant.
+        """
+        print(f"🔍 Streaming emails for user {user_id} (last {days_back} days, max {max_emails})")
+
+        if not self.gmail:
+            print("📧 Initializing Gmail service...")
+            credentials_file = os.getenv('GMAIL_CREDENTIALS_FILE')
+            if credentials_file and os.path.exists(credentials_file):
+                from gmail_integration import GmailIntegrator
+                self.gmail = GmailIntegrator(credentials_file)
+            else:
+                raise Exception("Gmail credentials not found")
+
+        if not search_query:
+            search_query = ("job OR internship OR career OR application OR deadline OR interview OR "
+                          "assessment OR hiring OR recruitment OR offer OR position OR employment OR "
+                          "from:careers OR from:hr OR from:recruitment OR from:noreply")
+
+        if hasattr(self.gmail, 'iter_recent_emails'):
+            emails = self.gmail.iter_recent_emails(
+                max_results=max_emails,
+                days_back=days_back,
+                query=search_query,
+                prefilter=self.rule_based_system.cheap_prefilter
+            )
+        else:
+            emails = self.gmail.get_recent_emails(
+                max_results=max_emails,
+                days_back=days_back,
+                query=search_query
+            )
+
+        for email, result in self._analyze_emails(emails):
+            if isinstance(result, Exception):
+                print(f"❌ Error processing email '{email.get('subject', 'Unknown')}': {result}")
+                continue
+            yield result
+
     def process_user_emails(self, user_id, max_emails=50, days_back=7, search_query=""):
         """Process real emails from user's Gmail account"""
         try:
@@ -632,5 +1229,70 @@ def main():
         else:
             print("❌ Invalid choice, please try again")
 
+def run_daemon(port=8765):
+    """Long-lived server mode
+
+    Builds the IntegratedEmailReminderSystem once and serves the menu
+    actions over local HTTP, so OAuth tokens, discovery-built services,
+    the analysis cache and Gmail history ids are amortized across
+    requests instead of being re-established per invocation.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    try:
+        system = IntegratedEmailReminderSystem(use_llm=True)
+    except Exception as e:
+        print(f"❌ System initialization failed: {e}")
+        return
+
+    class ReminderRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            params = parse_qs(parsed.query)
+            try:
+                if parsed.path == '/scan':
+                    payload = system.scan_gmail_and_process(
+                        max_emails=int(params.get('max_emails', ['50'])[0]),
+                        days_back=int(params.get('days_back', ['7'])[0])
+                    )
+                elif parsed.path == '/search':
+                    payload = system.search_job_emails(params.get('q', [''])[0])
+                elif parsed.path == '/upcoming':
+                    payload = system.get_upcoming_deadlines(
+                        int(params.get('days_ahead', ['30'])[0])
+                    )
+                else:
+                    self.send_error(404, "Unknown endpoint (try /scan, /search, /upcoming)")
+                    return
+
+                body = json.dumps(payload, default=str).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except Exception as e:
+                self.send_error(500, str(e))
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), ReminderRequestHandler)
+    print(f"🛰️ Daemon mode: http://127.0.0.1:{port} (endpoints: /scan /search /upcoming)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Daemon stopped")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Automated Email Reminder System")
+    parser.add_argument('--daemon', action='store_true',
+                        help="run as a long-lived local HTTP service instead of the menu")
+    parser.add_argument('--port', type=int, default=8765,
+                        help="port for --daemon mode (default 8765)")
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon(port=args.port)
+    else:
+        main()
\ No newline at end of file
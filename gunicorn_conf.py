@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the Email Reminder API Service
+
+Every endpoint here is I/O-bound (Gmail, Calendar and OAuth round trips),
+so gevent workers let each process multiplex many concurrent requests
+instead of pinning throughput to one blocking request per worker.
+
+Run with:
+    gunicorn -c gunicorn_conf.py api_service:app
+
+The Flask dev server (python api_service.py) remains for local development.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = 'gevent'
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_connections = 1000
+timeout = 120  # email scans can legitimately take a while
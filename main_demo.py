@@ -29,6 +29,13 @@ class EmailReminderSystem:
         
         # Track processed email IDs to prevent duplicates
         self.processed_email_ids = set()
+
+        # Compiled once so cheap_prefilter costs a single regex scan per email
+        self._prefilter_re = re.compile(
+            r'\b(intern(ship)?|interview|assessment|application|apply|deadline|'
+            r'offer|hr|careers?|jobs?|recruit\w*|hiring|position|opportunity)\b',
+            re.IGNORECASE
+        )
         
         self.deadline_patterns = [
             # Date patterns with context
@@ -120,6 +127,16 @@ class EmailReminderSystem:
             print(f"  ❌ Failed to parse date '{date_string}': {e}")
             return None
 
+    def cheap_prefilter(self, email_data: Dict) -> bool:
+        """
+        Fast subject/sender screen - True if the email could be job-related.
+
+        Runs one precompiled regex so callers can skip expensive analysis
+        (LLM calls in particular) for obviously unrelated mail.
+        """
+        text = f"{email_data.get('subject', '')} {email_data.get('sender', '')}"
+        return self._prefilter_re.search(text) is not None
+
     def classify_email_rule_based(self, email_data: Dict) -> Dict:
         """
         Classify email using rule-based approach (no LLM needed)